@@ -0,0 +1,165 @@
+"""Headless batch analysis of a directory or glob of PDF/DOCX technical annexes
+
+Usage:  python batch_cli.py "drafts/**/*.pdf" other_dir/ -o results.jsonl --workers 8
+One JSON line per proposal is written to stdout (or --output); progress goes to stderr.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+SUPPORTED_EXTENSIONS = {".pdf": "pdf", ".docx": "docx"}
+
+# Analyzers are built once per worker process by _init_worker
+_cost_analyzer = None
+_annex_analyzer = None
+
+
+def collect_files(patterns: List[str], recursive: bool = False) -> List[str]:
+    """Expand directories and glob patterns into a sorted, de-duplicated list of supported files"""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*") if recursive else os.path.join(pattern, "*")
+        for path in glob.glob(pattern, recursive=True):
+            if os.path.isfile(path) and os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS:
+                files.append(os.path.abspath(path))
+    return sorted(set(files))
+
+
+def _init_worker():
+    global _cost_analyzer, _annex_analyzer
+    from cost_core import COSTAnalyzer, TechnicalAnnexComprehensiveAnalyzer
+    _cost_analyzer = COSTAnalyzer()
+    _annex_analyzer = TechnicalAnnexComprehensiveAnalyzer()
+
+
+def analyze_file(path: str) -> Dict:
+    """Worker task: extraction, technical compliance, section coverage and sentence scoring for one file"""
+    from cost_core.stage_timing import StageTimer
+    from cost_core.text_extraction import extract_document
+
+    timer = StageTimer()
+    record = {"file": path, "status": "ok"}
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+        kind = SUPPORTED_EXTENSIONS[os.path.splitext(path)[1].lower()]
+
+        # Spans opened inside the analyzers (anonymity, PDF parsing) are nested under these stages
+        with timer.activate():
+            # Each worker already has its own process, so large PDFs are extracted serially here
+            with timer.span("extraction"):
+                document = extract_document(data, kind, parallel_threshold=sys.maxsize)
+            text = document["text"]
+
+            layout = None
+            if kind == "pdf":
+                with timer.span("layout_scan"):
+                    layout = _cost_analyzer.analyze_pdf_layout(data)
+
+            with timer.span("technical_compliance"):
+                compliance = _cost_analyzer.analyze_technical_compliance(
+                    text, len(data) / (1024 * 1024), document["page_count"], document["page_offsets"], layout,
+                    document.get("anonymity_violations")
+                )
+
+            with timer.span("section_coverage"):
+                coverage = _cost_analyzer.analyze_section_coverage(text)
+
+            with timer.span("sentence_scoring"):
+                scoring = _annex_analyzer.analyze_document(text)
+
+        record.update({
+            "page_count": document["page_count"],
+            "characters": len(text),
+            "technical_compliance": compliance,
+            "section_coverage": coverage,
+            "sentence_scoring": {
+                "document_score": scoring["document_score"],
+                "sentence_count": len(scoring["batch"]),
+                "reused_sentences": scoring["reused_sentences"],
+                "sections_detected": scoring["sections_detected"],
+                "section_summary": scoring["section_summary"]
+            }
+        })
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+
+    timings = timer.totals()
+    timings["total"] = time.perf_counter() - timer.started
+    record["timings"] = {stage: round(seconds, 4) for stage, seconds in timings.items()}
+    return record
+
+
+def run_batch(files: List[str], output, workers: int = None, progress=sys.stderr) -> Dict:
+    """Analyse files across a process pool, writing each JSON line as soon as its file finishes"""
+    started = time.perf_counter()
+    succeeded, failed = 0, 0
+    file_seconds = 0.0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(analyze_file, path) for path in files]
+        for done, future in enumerate(as_completed(futures), start=1):
+            record = future.result()
+            output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            output.flush()
+
+            if record["status"] == "ok":
+                succeeded += 1
+            else:
+                failed += 1
+            file_seconds += record["timings"]["total"]
+            if progress is not None:
+                detail = "" if record["status"] == "ok" else f" ({record['error']})"
+                progress.write(
+                    f"[{done}/{len(files)}] {record['status']:5} {record['timings']['total']:7.2f}s "
+                    f"{os.path.basename(record['file'])}{detail}\n"
+                )
+
+    elapsed = time.perf_counter() - started
+    return {
+        "files": len(files),
+        "succeeded": succeeded,
+        "failed": failed,
+        "wall_seconds": round(elapsed, 2),
+        "files_per_second": round(len(files) / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_file_seconds": round(file_seconds / len(files), 3) if files else 0.0
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyse a batch of COST technical annexes without the Streamlit UI")
+    parser.add_argument("paths", nargs="+", help="Directories or glob patterns of PDF/DOCX annexes")
+    parser.add_argument("-o", "--output", help="Write JSON lines to this file instead of stdout")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Descend into subdirectories of directory paths")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the final summary to stderr")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.paths, args.recursive)
+    if not files:
+        print("No PDF or DOCX files matched", file=sys.stderr)
+        return 2
+
+    progress = None if args.quiet else sys.stderr
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            summary = run_batch(files, output, args.workers, progress)
+    else:
+        summary = run_batch(files, sys.stdout, args.workers, progress)
+
+    print(
+        f"Analysed {summary['files']} files ({summary['succeeded']} ok, {summary['failed']} failed) "
+        f"in {summary['wall_seconds']}s, {summary['files_per_second']} files/s, "
+        f"mean {summary['mean_file_seconds']}s per file",
+        file=sys.stderr
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+"""Benchmark suite for the analyzer hot paths over the bundled reference corpus and synthetic annexes
+
+Run:      python benchmark.py -o baseline.json
+Compare:  python benchmark.py --compare baseline.json -o current.json
+          python benchmark.py --compare baseline.json --results current.json   (no rerun)
+Cases run against every PDF/RTF in "Documents for the Open Call" and against generated annexes of
+increasing size. Results are JSON; compare mode exits with status 1 when any case regresses.
+"""
+import io
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import statistics
+from typing import Callable, Dict, List, Tuple
+
+BENCHMARK_FORMAT_VERSION = 1
+
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Documents for the Open Call")
+DEFAULT_SYNTHETIC_WORDS = [2000, 8000, 32000]
+
+LINES_PER_PDF_PAGE = 50
+
+def synthetic_annex(target_words: int, seed: int = 0) -> str:
+    """Technical Annex text with every mandatory heading, built from the annotated example sentences"""
+    from cost_core.frameworks import load_frameworks
+    from cost_core.section_index import MANDATORY_SECTIONS
+
+    frameworks = load_frameworks()
+    sentences = [sentence.text for _, sentence in frameworks.original_document_analysis.sentences]
+    sentences += [sentence.text for _, sentence in frameworks.actual_document_content.sentences]
+    # A few phrases that the anonymity check must find, so it is exercised on its matching path too
+    sentences += [
+        "As shown in our previous work, the approach scales to large networks.",
+        "Prof. Smith et al. reported similar results in 2021."
+    ]
+
+    rng = random.Random(f"{seed}:{target_words}")
+    words_per_section = max(1, target_words // len(MANDATORY_SECTIONS))
+    lines = []
+    for number, heading in enumerate(MANDATORY_SECTIONS, start=1):
+        lines.append(f"{number}. {heading}")
+        section_words = 0
+        while section_words < words_per_section:
+            paragraph = " ".join(rng.choice(sentences) for _ in range(rng.randint(2, 5)))
+            lines.append(paragraph)
+            section_words += len(paragraph.split())
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _wrap_lines(text: str, width: int = 90) -> List[str]:
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            if line and len(line) + 1 + len(word) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        lines.append(line)
+    return lines
+
+
+def synthetic_pdf(text: str) -> bytes:
+    """Minimal multi-page Helvetica PDF of the given text, readable by PyPDF2"""
+    lines = [line.encode("latin-1", errors="replace") for line in _wrap_lines(text)]
+    pages = [lines[i:i + LINES_PER_PDF_PAGE] for i in range(0, len(lines), LINES_PER_PDF_PAGE)] or [[]]
+
+    # Object 1 catalog, 2 page tree, 3 font, then a (page, content stream) pair per page
+    objects = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects.append(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(pages)))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for page_id, page_lines in zip(page_ids, pages):
+        escaped = [line.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") for line in page_lines]
+        stream = b"BT /F1 10 Tf 14 TL 50 800 Td " + b" ".join(b"(%s) '" % line for line in escaped) + b" ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+
+def synthetic_docx(text: str) -> bytes:
+    from docx import Document
+
+    document = Document()
+    for paragraph in text.split("\n"):
+        document.add_paragraph(paragraph)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def measure(func: Callable, repeat: int = 7, min_sample_seconds: float = 0.05) -> Dict:
+    """Per-call timing statistics; fast calls are looped so each sample lasts at least min_sample_seconds"""
+    started = time.perf_counter()
+    func()
+    first_call = time.perf_counter() - started
+    loops = max(1, math.ceil(min_sample_seconds / first_call)) if first_call > 0 else 1000
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops)
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "min_seconds": min(samples),
+        "median_seconds": statistics.median(samples),
+        "mean_seconds": statistics.fmean(samples),
+        "stdev_seconds": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "first_call_seconds": first_call
+    }
+
+
+class BenchmarkDocument:
+    """One benchmark input: its text plus the original bytes when extraction can be timed"""
+
+    def __init__(self, name: str, text: str, data: bytes = None, kind: str = None, text_cases: bool = True):
+        self.name = name
+        self.text = text
+        self.data = data
+        self.kind = kind
+        # False when another document already times the text paths on identical text
+        self.text_cases = text_cases
+
+    def metadata(self) -> Dict:
+        return {
+            "characters": len(self.text),
+            "words": len(self.text.split()),
+            "bytes": len(self.data) if self.data is not None else None
+        }
+
+
+def corpus_documents(corpus_dir: str) -> List[BenchmarkDocument]:
+    """PDF documents with their extracted text, and RTF documents converted to plain text"""
+    from cost_core.text_extraction import extract_pdf_document
+    from cost_core.rtf_text import rtf_to_text
+
+    documents = []
+    for filename in sorted(os.listdir(corpus_dir)):
+        path = os.path.join(corpus_dir, filename)
+        extension = os.path.splitext(filename)[1].lower()
+        if extension == ".pdf":
+            with open(path, "rb") as handle:
+                data = handle.read()
+            text = extract_pdf_document(data)["text"]
+            documents.append(BenchmarkDocument(f"corpus/{filename}", text, data, "pdf"))
+        elif extension == ".rtf":
+            with open(path, "r", encoding="latin-1") as handle:
+                text = rtf_to_text(handle.read())
+            documents.append(BenchmarkDocument(f"corpus/{filename}", text))
+    return documents
+
+
+def synthetic_documents(sizes: List[int], seed: int = 0) -> List[BenchmarkDocument]:
+    """Generated annexes at each target word count, as both PDF and DOCX"""
+    documents = []
+    for words in sizes:
+        text = synthetic_annex(words, seed)
+        pdf_data = synthetic_pdf(text)
+        documents.append(BenchmarkDocument(f"synthetic/annex-{words}w.pdf", text, pdf_data, "pdf"))
+        documents.append(
+            BenchmarkDocument(f"synthetic/annex-{words}w.docx", text, synthetic_docx(text), "docx", text_cases=False)
+        )
+    return documents
+
+
+def document_cases(document: BenchmarkDocument) -> List[Tuple[str, Callable]]:
+    """(case name, zero-argument callable) for every hot path that applies to the document"""
+    from cost_core import COSTAnalyzer, TechnicalAnnexComprehensiveAnalyzer
+    from cost_core import COSTDocumentDeepAnalyzer, ActualCOSTDocumentAnalyzer
+    from cost_core.annex_analyzer import split_sentences
+    from cost_core.frameworks import SentenceRecord
+    from cost_core.institutions import load_institution_index
+    from cost_core.section_index import SectionIndex
+    from cost_core.text_extraction import extract_pdf_document, extract_docx_document
+    from cost_core.pdf_layout import scan_pdf_layout
+
+    cost_analyzer = COSTAnalyzer()
+    institution_index = load_institution_index()
+    annex_analyzer = TechnicalAnnexComprehensiveAnalyzer()
+    deep_analyzer = COSTDocumentDeepAnalyzer()
+    actual_analyzer = ActualCOSTDocumentAnalyzer()
+    text = document.text
+
+    sentences = split_sentences(text)
+    section_index = SectionIndex(
+        text, annex_analyzer.evaluation_framework["technical_format_requirements"]["mandatory_sections"]
+    )
+    sections = section_index.sections_for([offset for offset, _ in sentences])
+    scored = list(zip([sentence for _, sentence in sentences], sections))
+    records = [SentenceRecord(sentence) for sentence, _ in scored]
+
+    def sentence_criteria():
+        for position, (sentence, section) in enumerate(scored):
+            annex_analyzer.analyze_sentence_against_all_criteria(sentence, section, position)
+
+    def deep_scorers():
+        for record in records:
+            deep_analyzer.analyze_sentence_effectiveness(record)
+            deep_analyzer.assess_sentence_strategy(record)
+            actual_analyzer.analyze_actual_sentence_effectiveness(record)
+
+    cases = []
+    # Extraction is timed on the uncached extractors so repeated runs measure parsing, not cache hits
+    if document.kind == "pdf":
+        cases.append(("extract_pdf", lambda: extract_pdf_document(document.data)))
+        cases.append(("pdf_layout", lambda: scan_pdf_layout(document.data)))
+    elif document.kind == "docx":
+        cases.append(("extract_docx", lambda: extract_docx_document(document.data)))
+    if not document.text_cases:
+        return cases
+    cases += [
+        ("check_anonymity", lambda: cost_analyzer._check_anonymity(text)),
+        ("institution_mentions", lambda: institution_index.scan(text)),
+        ("section_coverage", lambda: cost_analyzer.analyze_section_coverage(text)),
+        ("sentence_criteria", sentence_criteria),
+        ("document_scoring", lambda: annex_analyzer.analyze_document(text, score_cache=None)),
+        ("deep_scorers", deep_scorers)
+    ]
+    return cases
+
+
+def run_suite(documents: List[BenchmarkDocument], repeat: int = 7, case_filter: str = None,
+              progress=sys.stderr) -> Dict:
+    """Time every case on every document, returning the JSON-serialisable results document"""
+    results = {}
+    for document in documents:
+        metadata = document.metadata()
+        for case, func in document_cases(document):
+            case_id = f"{document.name}::{case}"
+            if case_filter and case_filter not in case_id:
+                continue
+            timing = measure(func, repeat)
+            timing.update(metadata)
+            if metadata["characters"]:
+                timing["characters_per_second"] = metadata["characters"] / timing["median_seconds"]
+            results[case_id] = timing
+            if progress is not None:
+                progress.write(f"{timing['median_seconds'] * 1000:10.2f} ms  {case_id}\n")
+                progress.flush()
+
+    import numpy
+    return {
+        "format_version": BENCHMARK_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "numpy": numpy.__version__
+        },
+        "results": results
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.3, min_delta_seconds: float = 0.0005,
+                    statistic: str = "min") -> Dict:
+    """Classify each case by its change in per-call time; small absolute changes are treated as noise"""
+    # The fastest sample is the least disturbed by other load on the machine, so it is the default
+    field = f"{statistic}_seconds"
+    rows = []
+    for case_id, timing in current["results"].items():
+        previous = baseline["results"].get(case_id)
+        if previous is None:
+            rows.append({"case": case_id, "status": "new", "current_seconds": timing[field]})
+            continue
+        before, after = previous[field], timing[field]
+        ratio = after / before if before > 0 else math.inf
+        if abs(after - before) < min_delta_seconds:
+            status = "unchanged"
+        elif ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append({
+            "case": case_id,
+            "status": status,
+            "baseline_seconds": before,
+            "current_seconds": after,
+            "ratio": ratio
+        })
+    for case_id in baseline["results"]:
+        if case_id not in current["results"]:
+            rows.append({"case": case_id, "status": "missing"})
+
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    return {
+        "statistic": statistic,
+        "threshold": threshold,
+        "min_delta_seconds": min_delta_seconds,
+        "counts": counts,
+        "cases": rows
+    }
+
+
+def print_comparison(comparison: Dict, output=sys.stdout, show_all: bool = False):
+    for row in comparison["cases"]:
+        if not show_all and row["status"] in ("unchanged", "missing", "new"):
+            continue
+        if "ratio" in row:
+            output.write(
+                f"{row['status']:11} {row['ratio']:6.2f}x  {row['baseline_seconds'] * 1000:10.2f} ms -> "
+                f"{row['current_seconds'] * 1000:10.2f} ms  {row['case']}\n"
+            )
+        else:
+            output.write(f"{row['status']:11} {'':7}  {row['case']}\n")
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(comparison["counts"].items()))
+    output.write(
+        f"Compared {comparison['statistic']} times against baseline "
+        f"(threshold {comparison['threshold']:.0%}): {summary}\n"
+    )
+
+
+def _load_json(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    if data.get("format_version") != BENCHMARK_FORMAT_VERSION:
+        raise ValueError(f"{path} has benchmark format {data.get('format_version')!r}, "
+                         f"expected {BENCHMARK_FORMAT_VERSION}")
+    return data
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the COST analyzer hot paths")
+    parser.add_argument("-o", "--output", help="Write benchmark results JSON to this file")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR, help="Directory of reference PDF/RTF documents")
+    parser.add_argument("--no-corpus", action="store_true", help="Skip the reference corpus")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SYNTHETIC_WORDS),
+                        help="Comma-separated word counts of synthetic annexes; empty to skip them")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic annex generator")
+    parser.add_argument("-r", "--repeat", type=int, default=7, help="Timed samples per case")
+    parser.add_argument("-k", "--filter", help="Only run cases whose id contains this text")
+    parser.add_argument("--compare", metavar="BASELINE", help="Flag regressions against this results file")
+    parser.add_argument("--results", help="With --compare, compare this existing results file instead of running")
+    parser.add_argument("--threshold", type=float, default=0.3,
+                        help="Relative change in per-call time that counts as a regression or improvement")
+    parser.add_argument("--statistic", choices=["min", "median", "mean"], default="min",
+                        help="Per-call timing compared against the baseline")
+    parser.add_argument("--min-delta", type=float, default=0.0005,
+                        help="Absolute change in seconds below which a case is treated as unchanged")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not print per-case timings")
+    args = parser.parse_args(argv)
+
+    if args.results:
+        if not args.compare:
+            parser.error("--results requires --compare")
+        current = _load_json(args.results)
+    else:
+        documents = [] if args.no_corpus else corpus_documents(args.corpus)
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+        documents += synthetic_documents(sizes, args.seed)
+        if not documents:
+            print("Nothing to benchmark", file=sys.stderr)
+            return 2
+        current = run_suite(documents, args.repeat, args.filter, None if args.quiet else sys.stderr)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as handle:
+                json.dump(current, handle, indent=2)
+        elif not args.compare:
+            json.dump(current, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+
+    if args.compare:
+        comparison = compare_results(_load_json(args.compare), current, args.threshold, args.min_delta,
+                                     args.statistic)
+        print_comparison(comparison, show_all=not args.quiet)
+        return 1 if comparison["counts"].get("regression") else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
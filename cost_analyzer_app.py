@@ -1,20 +1,23 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
+import time
+
+# Measured from the top of every script run, reported in the sidebar
+SCRIPT_STARTED = time.perf_counter()
+
 import re
 import io
+import os
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import PyPDF2
-from docx import Document
-import openai
 from typing import Dict, List, Tuple, Any
 import json
-from deep_analysis_module import create_deep_analysis_dashboard
-from critical_review_module import create_critical_review_dashboard
-from technical_annex_analyzer import create_technical_annex_comprehensive_analysis_tab
+from cost_core.import_timing import timed_import, import_report
+from cost_core.stage_timing import StageTimer
+
+with timed_import("streamlit"):
+    import streamlit as st
+with timed_import("cost_core.proposal_analyzer"):
+    from cost_core import COSTAnalyzer
+
+# Page modules, plotting libraries, PDF/DOCX parsers and openai are imported when first needed
 
 # Configuration
 st.set_page_config(
@@ -24,237 +27,56 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-class COSTAnalyzer:
-    def __init__(self):
-        self.openai_client = openai.OpenAI(api_key=st.secrets.get("OPENAI_API_KEY", ""))
-        
-        # COST 2025 Requirements Framework
-        self.requirements = {
-            "technical_format": {
-                "max_pages": 15,
-                "font": "Arial",
-                "font_size": 10,
-                "line_spacing": 1,
-                "max_file_size_mb": 10,
-                "format": "PDF",
-                "anonymity_required": True
-            },
-            "evaluation_criteria": {
-                "excellence": {
-                    "weight": 0.33,
-                    "threshold": 3.0,
-                    "subcriteria": [
-                        "scientific_innovation",
-                        "technological_advancement", 
-                        "networking_value",
-                        "interdisciplinary_approach",
-                        "open_science_commitment"
-                    ]
-                },
-                "impact": {
-                    "weight": 0.33,
-                    "threshold": 3.0,
-                    "subcriteria": [
-                        "societal_impact",
-                        "economic_impact",
-                        "scientific_impact",
-                        "stakeholder_engagement",
-                        "sdg_contribution"
-                    ]
-                },
-                "implementation": {
-                    "weight": 0.34,
-                    "threshold": 3.0,
-                    "subcriteria": [
-                        "project_management",
-                        "timeline_realism",
-                        "resource_allocation",
-                        "leadership_capability",
-                        "risk_management"
-                    ]
-                }
-            },
-            "network_requirements": {
-                "min_countries": 7,
-                "min_itc_percentage": 50,
-                "itc_countries": [
-                    "Bulgaria", "Croatia", "Cyprus", "Czech Republic", "Estonia",
-                    "Hungary", "Latvia", "Lithuania", "Malta", "Poland", 
-                    "Portugal", "Romania", "Slovakia", "Slovenia"
-                ]
-            },
-            "content_structure": {
-                "state_of_art": {"required": True, "weight": 0.15},
-                "rationale_networking": {"required": True, "weight": 0.15},
-                "critical_mass": {"required": True, "weight": 0.10},
-                "impact_objectives": {"required": True, "weight": 0.20},
-                "stakeholder_involvement": {"required": True, "weight": 0.15},
-                "action_structure": {"required": True, "weight": 0.10},
-                "work_plan": {"required": True, "weight": 0.10},
-                "deliverables": {"required": True, "weight": 0.05}
-            }
-        }
-        
-        # Policy compliance requirements
-        self.policy_requirements = {
-            "inclusiveness": {
-                "itc_participation_min": 50,
-                "itc_leadership_min": 50,
-                "geographic_balance": True
-            },
-            "gender_equality": {
-                "female_participation_target": 50,
-                "gender_equality_plan_required": True,
-                "gear_tool_usage": True
-            },
-            "young_researchers": {
-                "yri_participation_min": 50,
-                "yri_leadership_allocation": 45,
-                "mentorship_programs": True
-            }
-        }
+def get_setting(name: str, default: str = "") -> str:
+    """Setting from Streamlit secrets, falling back to the environment when no secrets file exists"""
+    try:
+        value = st.secrets.get(name)
+    except FileNotFoundError:
+        value = None
+    return value if value is not None else os.environ.get(name, default)
 
-    def extract_text_from_pdf(self, pdf_file) -> str:
-        """Extract text from uploaded PDF file"""
-        try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
-        except Exception as e:
-            st.error(f"Error reading PDF: {str(e)}")
-            return ""
+@st.cache_resource
+def get_cost_analyzer(api_key: str, base_url: str) -> COSTAnalyzer:
+    """One analyzer, and so one pooled OpenAI client, per server process and endpoint configuration"""
+    return COSTAnalyzer(api_key=api_key, base_url=base_url)
 
-    def extract_text_from_docx(self, docx_file) -> str:
-        """Extract text from uploaded DOCX file"""
-        try:
-            doc = Document(docx_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
-        except Exception as e:
-            st.error(f"Error reading DOCX: {str(e)}")
-            return ""
-
-    def analyze_technical_compliance(self, file_content: str, file_size_mb: float) -> Dict:
-        """Analyze technical format compliance"""
-        compliance_score = 100
-        issues = []
-        
-        # File size check
-        if file_size_mb > self.requirements["technical_format"]["max_file_size_mb"]:
-            compliance_score -= 20
-            issues.append(f"File size ({file_size_mb:.1f}MB) exceeds 10MB limit")
-        
-        # Page count estimation (rough)
-        estimated_pages = len(file_content.split()) / 300  # Approximate words per page
-        if estimated_pages > self.requirements["technical_format"]["max_pages"]:
-            compliance_score -= 30
-            issues.append(f"Estimated {estimated_pages:.1f} pages exceeds 15-page limit")
-        
-        # Anonymity check
-        anonymity_violations = self._check_anonymity(file_content)
-        if anonymity_violations:
-            compliance_score -= 25
-            issues.extend(anonymity_violations)
-        
-        return {
-            "score": max(0, compliance_score),
-            "issues": issues,
-            "estimated_pages": estimated_pages,
-            "file_size_mb": file_size_mb
-        }
-
-    def _check_anonymity(self, text: str) -> List[str]:
-        """Check for potential anonymity violations"""
-        violations = []
-        
-        # Common patterns that might violate anonymity
-        patterns = [
-            (r"\b[A-Z][a-z]+ University\b", "University names detected"),
-            (r"\bDr\. [A-Z][a-z]+\b", "Author names with titles detected"),
-            (r"\bProf\. [A-Z][a-z]+\b", "Professor names detected"),
-            (r"\b[A-Z][a-z]+ et al\.\b", "Author citations detected"),
-            (r"\bour previous work\b", "Self-reference detected"),
-            (r"\bwe have shown\b", "Self-reference detected"),
-            (r"\bin our lab\b", "Lab reference detected")
-        ]
-        
-        for pattern, message in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                violations.append(message)
-        
-        return violations
+def load_plotting():
+    """pandas and plotly, imported the first time a table or chart is rendered"""
+    with timed_import("pandas"):
+        import pandas as pd
+    with timed_import("plotly.graph_objects"):
+        import plotly.graph_objects as go
+    return pd, go
 
-    def analyze_content_quality(self, text: str) -> Dict:
-        """Analyze content quality using AI"""
-        if not self.openai_client.api_key:
-            return {"error": "OpenAI API key not configured"}
-        
-        try:
-            prompt = f"""
-            Analyze this COST Action technical annex excerpt for quality across these dimensions:
-            
-            1. Scientific Excellence (0-5 scale)
-            2. Innovation Level (0-5 scale)
-            3. Networking Rationale (0-5 scale)
-            4. Impact Potential (0-5 scale)
-            5. Implementation Feasibility (0-5 scale)
-            
-            Text excerpt (first 2000 chars):
-            {text[:2000]}
-            
-            Provide scores and brief justifications in JSON format:
-            {{
-                "scientific_excellence": {{"score": X, "justification": "..."}},
-                "innovation": {{"score": X, "justification": "..."}},
-                "networking": {{"score": X, "justification": "..."}},
-                "impact": {{"score": X, "justification": "..."}},
-                "implementation": {{"score": X, "justification": "..."}}
-            }}
-            """
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            return result
-            
-        except Exception as e:
-            return {"error": f"AI analysis failed: {str(e)}"}
+def show_startup_timings():
+    """Sidebar report of this run's duration and of first-import times in this server process"""
+    with st.sidebar.expander("⏱️ Startup Timings"):
+        st.caption(f"This page rendered in {time.perf_counter() - SCRIPT_STARTED:.2f}s")
+        report = import_report()
+        if not report:
+            st.caption("No module imports recorded yet")
+        for entry in report:
+            st.write(f"`{entry['module']}`: {entry['seconds']:.3f}s")
 
-    def analyze_section_coverage(self, text: str) -> Dict:
-        """Analyze coverage of required sections"""
-        sections_found = {}
-        
-        section_keywords = {
-            "state_of_art": ["state of the art", "current research", "background", "literature review"],
-            "rationale_networking": ["networking", "collaboration", "rationale", "why network"],
-            "critical_mass": ["critical mass", "network size", "participants", "consortium"],
-            "impact_objectives": ["impact", "objectives", "goals", "outcomes"],
-            "stakeholder_involvement": ["stakeholders", "industry", "policy", "end users"],
-            "action_structure": ["structure", "organization", "management", "governance"],
-            "work_plan": ["work plan", "tasks", "activities", "timeline"],
-            "deliverables": ["deliverables", "outputs", "results", "products"]
-        }
-        
-        for section, keywords in section_keywords.items():
-            coverage_score = 0
-            for keyword in keywords:
-                matches = len(re.findall(keyword, text, re.IGNORECASE))
-                coverage_score += min(matches * 10, 50)  # Cap at 50 per keyword
-            
-            sections_found[section] = {
-                "coverage_score": min(coverage_score, 100),
-                "weight": self.requirements["content_structure"][section]["weight"]
+def show_performance_panel(timer: StageTimer):
+    """Collapsible per-stage timing breakdown of the current analysis"""
+    with st.expander("⏱️ Performance"):
+        spans = timer.report()
+        if not spans:
+            st.caption("No stages timed yet")
+            return
+        st.caption(f"Pipeline stages took {timer.total_seconds():.2f}s; nested stages are part of the stage above them")
+        pd, _ = load_plotting()
+        stage_df = pd.DataFrame([
+            {
+                "Stage": "\u2003" * span["depth"] + span["stage"].replace("_", " ").title(),
+                "Started At (s)": span["offset_seconds"],
+                "Seconds": span["seconds"],
+                "Share": f"{span['share']:.0%}"
             }
-        
-        return sections_found
+            for span in spans
+        ])
+        st.dataframe(stage_df, use_container_width=True, hide_index=True)
 
 def create_compliance_dashboard(analyzer: COSTAnalyzer, analysis_results: Dict):
     """Create compliance visualization dashboard"""
@@ -300,6 +122,69 @@ def create_compliance_dashboard(analyzer: COSTAnalyzer, analysis_results: Dict):
         st.warning("Compliance Issues Detected:")
         for issue in tech_compliance['issues']:
             st.write(f"• {issue}")
+    
+    # Fonts, sizes and line spacing read from the PDF text operators
+    format_check = tech_compliance.get("format_check")
+    if format_check and format_check["characters"]:
+        tech_req = analyzer.requirements["technical_format"]
+        st.markdown("**Fonts and Sizes**")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric(f"Text in {tech_req['font']}", f"{format_check['font_share']:.0%}")
+        with col2:
+            st.metric(f"Text below {tech_req['font_size']}pt", f"{format_check['below_size_share']:.0%}")
+        with col3:
+            spacing = format_check["line_spacing"]
+            st.metric("Line Spacing (× font size)", f"{spacing:.2f}" if spacing is not None else "n/a")
+        
+        pd, _ = load_plotting()
+        with st.expander("🔤 Fonts by Page"):
+            layout_df = pd.DataFrame([
+                {
+                    "Page": page["page"],
+                    "Font": entry["font"],
+                    "Size (pt)": entry["size"],
+                    "Characters": entry["characters"],
+                    "Line Spacing": page["line_spacing"]
+                }
+                for page in tech_compliance.get("layout_pages", [])
+                for entry in page["fonts"]
+            ])
+            st.dataframe(layout_df, use_container_width=True, hide_index=True)
+    
+    # Every anonymity hit with where it occurs, so each one can be found and removed
+    violations = tech_compliance.get("anonymity_violations", [])
+    if violations:
+        pd, _ = load_plotting()
+        st.markdown(f"**Anonymity Violations ({len(violations)})**")
+        violations_df = pd.DataFrame([
+            {
+                "Page": violation["page"],
+                "Character Offset": violation["offset"],
+                "Matched Text": violation["match"],
+                "Issue": violation["message"]
+            }
+            for violation in violations
+        ])
+        st.dataframe(violations_df, use_container_width=True, hide_index=True)
+    
+    # Known organisations named in the text, to check that none of them identifies the proposers
+    mentions = tech_compliance.get("institution_mentions", [])
+    if mentions:
+        from cost_core.institutions import CATEGORY_LABELS
+        pd, _ = load_plotting()
+        with st.expander(f"🏛️ Named Institutions ({len(mentions)})"):
+            mentions_df = pd.DataFrame([
+                {
+                    "Page": mention["page"],
+                    "Character Offset": mention["offset"],
+                    "Matched Text": mention["match"],
+                    "Organisation": mention["organisation"],
+                    "Category": CATEGORY_LABELS.get(mention["category"], mention["category"])
+                }
+                for mention in mentions
+            ])
+            st.dataframe(mentions_df, use_container_width=True, hide_index=True)
 
 def create_quality_assessment_dashboard(analysis_results: Dict):
     """Create quality assessment visualization"""
@@ -308,10 +193,35 @@ def create_quality_assessment_dashboard(analysis_results: Dict):
     
     quality_analysis = analysis_results.get("content_quality", {})
     
+    from cost_core.llm_cache import llm_response_cache
+    with timed_import("openai"):
+        from cost_core.llm_client import rate_limited_client
+    pd, go = load_plotting()
+    
+    cache_stats = llm_response_cache.stats()
+    gateway_stats = rate_limited_client.stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("LLM Cache Hits", cache_stats["hits"])
+    with col2:
+        st.metric("LLM Cache Misses", cache_stats["misses"])
+    with col3:
+        st.metric("Cached Responses", cache_stats["entries"])
+    with col4:
+        st.metric("API Retries", gateway_stats["retries"])
+    
     if "error" in quality_analysis:
         st.error(quality_analysis["error"])
         return
     
+    coverage = quality_analysis.get("coverage")
+    if coverage:
+        st.caption(
+            f"Scored {coverage['chunks_analyzed']} section chunks "
+            f"({coverage['characters_analyzed']:,} characters)"
+            + (f", {coverage['chunks_failed']} failed" if coverage["chunks_failed"] else "")
+        )
+    
     # Quality scores radar chart
     categories = []
     scores = []
@@ -373,6 +283,8 @@ def create_section_coverage_dashboard(analysis_results: Dict):
     coverage_scores = []
     weights = []
     
+    pd, go = load_plotting()
+    
     for section, data in section_analysis.items():
         sections.append(section.replace("_", " ").title())
         coverage_scores.append(data["coverage_score"])
@@ -415,6 +327,18 @@ def create_section_coverage_dashboard(analysis_results: Dict):
     
     st.plotly_chart(fig_coverage, use_container_width=True)
     
+    # Where each section's heading was found and how much of its content sits under it
+    heading_df = pd.DataFrame([
+        {
+            "Section": section.replace("_", " ").title(),
+            "Heading Found": "Yes" if data.get("heading_found") else "No",
+            "Section Length (chars)": data.get("section_characters", 0),
+            "Keyword Hits Within Section": data.get("in_section_matches", 0)
+        }
+        for section, data in section_analysis.items()
+    ])
+    st.dataframe(heading_df, use_container_width=True)
+    
     # Weighted coverage score
     total_weighted_score = sum(
         data["coverage_score"] * data["weight"] 
@@ -484,8 +408,8 @@ def main():
     st.title("COST 2025 Proposal Analyzer")
     st.markdown("Comprehensive analysis tool for COST Action proposals against 2025 requirements")
     
-    # Initialize analyzer
-    analyzer = COSTAnalyzer()
+    # Initialize analyzer; OPENAI_BASE_URL points it at another OpenAI-compatible endpoint
+    analyzer = get_cost_analyzer(get_setting("OPENAI_API_KEY"), get_setting("OPENAI_BASE_URL"))
     
     # Sidebar navigation
     st.sidebar.title("Navigation")
@@ -505,48 +429,89 @@ def main():
         )
         
         if uploaded_file is not None:
+            # Spans for every pipeline stage of this run, shown in the performance panel and the report
+            timer = StageTimer()
+            
             # Get file info
             file_size_mb = uploaded_file.size / (1024 * 1024)
             
+            # Read the page count and fonts from the PDF structure before extracting any text
+            page_count = None
+            layout = None
+            if uploaded_file.type == "application/pdf":
+                with timer.span("layout_scan"):
+                    layout = analyzer.analyze_pdf_layout(uploaded_file)
+                page_count = layout.get("page_count")
+                max_pages = analyzer.requirements["technical_format"]["max_pages"]
+                if page_count is not None and page_count > max_pages:
+                    st.warning(f"Document has {page_count} pages, exceeding the {max_pages}-page limit")
+            
             # Extract text
-            with st.spinner("Processing document..."):
-                if uploaded_file.type == "application/pdf":
-                    text_content = analyzer.extract_text_from_pdf(uploaded_file)
-                else:
-                    text_content = analyzer.extract_text_from_docx(uploaded_file)
+            with st.spinner("Processing document..."), timer.activate(), timer.span("extraction"):
+                kind = "pdf" if uploaded_file.type == "application/pdf" else "docx"
+                document = analyzer.extract_document(uploaded_file, kind)
+                if "error" in document:
+                    st.error(document["error"])
+                text_content = document.get("text", "")
             
             if text_content:
                 st.success(f"Document processed successfully! ({len(text_content)} characters)")
                 
+                # Report the planned LLM requests before any of them is sent
+                with timer.span("llm_planning"):
+                    quality_plan = analyzer.plan_content_quality_requests(text_content)
+                st.info(
+                    f"AI quality analysis planned as {quality_plan.request_count} request(s), "
+                    f"~{quality_plan.estimated_tokens:,} prompt tokens"
+                )
+                
                 # Run analysis
-                with st.spinner("Analyzing document..."):
-                    analysis_results = {
-                        "technical_compliance": analyzer.analyze_technical_compliance(text_content, file_size_mb),
-                        "content_quality": analyzer.analyze_content_quality(text_content),
-                        "section_coverage": analyzer.analyze_section_coverage(text_content)
-                    }
+                with st.spinner("Analyzing document..."), timer.activate():
+                    analysis_results = {}
+                    with timer.span("technical_compliance"):
+                        analysis_results["technical_compliance"] = analyzer.analyze_technical_compliance(
+                            text_content, file_size_mb, page_count, document.get("page_offsets"), layout,
+                            document.get("anonymity_violations")
+                        )
+                    with timer.span("content_quality"):
+                        analysis_results["content_quality"] = analyzer.analyze_content_quality(
+                            text_content, plan=quality_plan
+                        )
+                    with timer.span("section_coverage"):
+                        analysis_results["section_coverage"] = analyzer.analyze_section_coverage(text_content)
                 
                 # Create dashboard tabs
                 tab1, tab2, tab3, tab4 = st.tabs(["Compliance", "Quality", "Coverage", "Recommendations"])
                 
-                with tab1:
-                    create_compliance_dashboard(analyzer, analysis_results)
-                
-                with tab2:
-                    create_quality_assessment_dashboard(analysis_results)
+                with timer.span("charts"):
+                    with tab1, timer.span("compliance_dashboard"):
+                        create_compliance_dashboard(analyzer, analysis_results)
+                    
+                    with tab2, timer.span("quality_dashboard"):
+                        create_quality_assessment_dashboard(analysis_results)
+                    
+                    with tab3, timer.span("coverage_dashboard"):
+                        create_section_coverage_dashboard(analysis_results)
+                    
+                    with tab4, timer.span("recommendations"):
+                        create_recommendations_panel(analysis_results)
                 
-                with tab3:
-                    create_section_coverage_dashboard(analysis_results)
+                show_performance_panel(timer)
                 
-                with tab4:
-                    create_recommendations_panel(analysis_results)
+                # Every widget click reruns the script with extraction and LLM replies served from cache, so
+                # the report keeps the timings of the first run over this upload rather than of the rerun
+                upload_id = getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}:{uploaded_file.size}"
+                if st.session_state.get("timed_upload") != upload_id:
+                    st.session_state["timed_upload"] = upload_id
+                    st.session_state["upload_performance"] = timer.to_dict()
                 
                 # Download analysis report
                 if st.button("Generate Analysis Report"):
                     report_data = {
                         "timestamp": datetime.now().isoformat(),
                         "file_name": uploaded_file.name,
-                        "analysis_results": analysis_results
+                        "analysis_results": analysis_results,
+                        "performance": st.session_state["upload_performance"]
                     }
                     
                     st.download_button(
@@ -555,20 +520,27 @@ def main():
                         file_name=f"cost_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                         mime="application/json"
                     )
-            else:
+            elif "error" not in document:
                 st.error("Could not extract text from the uploaded file")
     
     elif page == "Deep Document Analysis":
+        with timed_import("deep_analysis_module"):
+            from deep_analysis_module import create_deep_analysis_dashboard
         create_deep_analysis_dashboard()
     
     elif page == "Critical Review":
+        with timed_import("critical_review_module"):
+            from critical_review_module import create_critical_review_dashboard
         create_critical_review_dashboard()
     
     elif page == "Technical Annex Analyzer":
+        with timed_import("technical_annex_analyzer"):
+            from technical_annex_analyzer import create_technical_annex_comprehensive_analysis_tab
         create_technical_annex_comprehensive_analysis_tab()
     
     elif page == "Requirements Overview":
         st.header("COST 2025 Requirements Overview")
+        pd, go = load_plotting()
         
         col1, col2 = st.columns(2)
         
@@ -595,9 +567,20 @@ def main():
             st.write(f"**Minimum Countries:** {net_req['min_countries']}")
             st.write(f"**Minimum ITC Percentage:** {net_req['min_itc_percentage']}%")
             
-            st.write("**ITC Countries:**")
-            for country in net_req["itc_countries"]:
-                st.write(f"• {country}")
+            # Country statuses from the Annex I country table
+            from cost_core.countries import STATUS_LABELS
+            st.write("**Annex I Countries:**")
+            countries_df = pd.DataFrame([
+                {
+                    "Country": country["name"],
+                    "ISO Code": country["iso_code"],
+                    "Status": STATUS_LABELS[country["status"]],
+                    "ITC": "Yes" if country["itc"] else "No"
+                }
+                for country in analyzer.countries.countries
+            ])
+            st.dataframe(countries_df, use_container_width=True, hide_index=True)
+            st.caption("Countries not listed are International Partner Countries")
         
         st.subheader("Evaluation Criteria")
         eval_criteria = analyzer.requirements["evaluation_criteria"]
@@ -616,31 +599,83 @@ def main():
     elif page == "Policy Compliance":
         st.header("Policy Compliance Framework")
         
-        st.subheader("Mission and Policies Visualization")
-        
-        # Sample data for policy compliance
-        policy_data = {
-            "ITC Participation": 58,
-            "Female Leadership": 50,
-            "Young Researchers": 45,
-            "Industry Participation": 40
-        }
-        
-        fig_policy = go.Figure(data=[
-            go.Bar(
-                x=list(policy_data.keys()),
-                y=list(policy_data.values()),
-                marker_color=['green' if v >= 50 else 'orange' if v >= 40 else 'red' for v in policy_data.values()]
-            )
-        ])
-        
-        fig_policy.update_layout(
-            title="Policy Compliance Metrics (%)",
-            yaxis_title="Percentage",
-            showlegend=False
+        st.subheader("Participant Roster")
+        roster_file = st.file_uploader(
+            "Upload the participant roster",
+            type=['csv', 'xlsx'],
+            help="One row per participant with a Country column and, where available, Gender, "
+                 "Young Researcher (yes/no) or Age, and Role columns"
         )
         
-        st.plotly_chart(fig_policy, use_container_width=True)
+        if roster_file is None:
+            st.info("Upload a participant roster to check ITC, gender, young researcher and leadership balance")
+        else:
+            kind = "xlsx" if roster_file.name.lower().endswith(".xlsx") else "csv"
+            with st.spinner("Evaluating roster..."):
+                started = time.perf_counter()
+                roster = analyzer.analyze_participant_roster(roster_file, kind)
+                elapsed = time.perf_counter() - started
+            
+            if "error" in roster:
+                st.error(roster["error"])
+            else:
+                metrics = roster["metrics"]
+                st.caption(f"{metrics['participants']} participants from {metrics['member_country_count']} COST Members "
+                           f"and {metrics['partner_country_count']} partner countries evaluated in {elapsed:.2f}s")
+                pd, go = load_plotting()
+                
+                # Measured metrics against their thresholds; metrics the roster cannot support are left out
+                measured = [check for check in roster["checks"] if check["met"] is not None]
+                percentage_checks = [check for check in measured if check["metric"] != "member_country_count"]
+                fig_policy = go.Figure(data=[
+                    go.Bar(
+                        x=[check["requirement"] for check in percentage_checks],
+                        y=[check["value"] for check in percentage_checks],
+                        marker_color=['green' if check["met"] else 'red' for check in percentage_checks],
+                        name="Roster"
+                    ),
+                    go.Scatter(
+                        x=[check["requirement"] for check in percentage_checks],
+                        y=[check["threshold"] for check in percentage_checks],
+                        mode="markers",
+                        marker=dict(symbol="line-ew-open", size=40, color="black"),
+                        name="Threshold"
+                    )
+                ])
+                fig_policy.update_layout(
+                    title="Policy Compliance Metrics (%)",
+                    yaxis_title="Percentage",
+                    yaxis_range=[0, 100]
+                )
+                st.plotly_chart(fig_policy, use_container_width=True)
+                
+                checks_df = pd.DataFrame([
+                    {
+                        "Requirement": check["requirement"],
+                        "Value": check["value"],
+                        "Threshold": check["threshold"],
+                        "Status": "✅ Met" if check["met"] else "❌ Not met" if check["met"] is False
+                        else "➖ Not in roster"
+                    }
+                    for check in roster["checks"]
+                ])
+                st.dataframe(checks_df, use_container_width=True, hide_index=True)
+                
+                with st.expander("Participants by Country"):
+                    from cost_core.countries import STATUS_LABELS
+                    countries_df = pd.DataFrame([
+                        {
+                            "Country": country["country"],
+                            "Status": STATUS_LABELS[country["status"]],
+                            "ITC": "Yes" if country["itc"] else "No",
+                            "Participants": country["participants"],
+                            "Female": country["female"],
+                            "Young Researchers": country["yri"],
+                            "Leadership Roles": country["leaders"]
+                        }
+                        for country in roster["countries"]
+                    ])
+                    st.dataframe(countries_df, use_container_width=True, hide_index=True)
         
         # Policy requirements table
         st.subheader("Policy Requirements Details")
@@ -704,6 +739,8 @@ def main():
         
         for mistake in common_mistakes:
             st.write(f"❌ {mistake}")
+    
+    show_startup_timings()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
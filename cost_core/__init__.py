@@ -0,0 +1,34 @@
+"""UI-free COST proposal analysis: extraction, compliance, coverage and sentence scoring
+
+Nothing in this package imports streamlit or plotly; openai is imported only when an AI analysis runs.
+Failures are returned as {"error": message, "error_code": code} results rather than shown in a UI.
+Public names are resolved on first access, so importing the package does not load every analyzer.
+"""
+import importlib
+
+_EXPORTS = {
+    "AnalysisError": "errors",
+    "error_result": "errors",
+    "extract_document": "text_extraction",
+    "load_document": "text_extraction",
+    "count_pdf_pages": "text_extraction",
+    "SectionIndex": "section_index",
+    "MANDATORY_SECTIONS": "section_index",
+    "StageTimer": "stage_timing",
+    "stage_span": "stage_timing",
+    "COSTAnalyzer": "proposal_analyzer",
+    "TechnicalAnnexComprehensiveAnalyzer": "annex_analyzer",
+    "COSTDocumentDeepAnalyzer": "deep_analysis",
+    "COSTCriticalReviewer": "critical_review",
+    "ActualCOSTDocumentAnalyzer": "corrected_deep_analysis"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,183 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Bump whenever extraction output changes so stale cache entries are ignored
+EXTRACTOR_VERSION = "4"
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "COST_ANALYZER_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "cost_analyzer_cache")
+)
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of raw file bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe in-process LRU mapping with a fixed number of entries"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache:
+    """Directory of JSON payloads with size-bounded, least-recently-used eviction"""
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            # Touch the entry so eviction treats it as recently used
+            os.utime(path, None)
+            return payload
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, payload: Dict):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            return
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the directory fits max_bytes"""
+        with self._lock:
+            entries = []
+            total_bytes = 0
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_bytes += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total_bytes <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total_bytes -= size
+                except OSError:
+                    pass
+
+    def clear(self):
+        with self._lock:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+            for name in names:
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+
+class ExtractionCache:
+    """Two-tier cache of extracted document text keyed by content hash and extractor version"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, memory_entries: int = 32,
+                 disk_max_bytes: int = 256 * 1024 * 1024):
+        self.memory = LRUCache(memory_entries)
+        self.disk = DiskCache(os.path.join(directory, "extraction"), disk_max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(data: bytes, kind: str) -> str:
+        return f"{kind}-v{EXTRACTOR_VERSION}-{content_hash(data)}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        payload = self.memory.get(key)
+        if payload is None:
+            payload = self.disk.get(key)
+            if payload is not None:
+                self.memory.put(key, payload)
+        if payload is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return payload
+
+    def put(self, key: str, payload: Dict):
+        self.memory.put(key, payload)
+        self.disk.put(key, payload)
+
+    def clear(self):
+        self.memory.clear()
+        self.disk.clear()
+
+
+def read_file_bytes(file_obj) -> bytes:
+    """Read all bytes from raw bytes, an uploaded file or a path without consuming the stream"""
+    if isinstance(file_obj, (bytes, bytearray)):
+        return bytes(file_obj)
+    if isinstance(file_obj, (str, os.PathLike)):
+        with open(file_obj, "rb") as f:
+            return f.read()
+    if hasattr(file_obj, "getvalue"):
+        return file_obj.getvalue()
+    position = file_obj.tell()
+    file_obj.seek(0)
+    data = file_obj.read()
+    file_obj.seek(position)
+    return data
+
+
+# Shared across Streamlit reruns and sessions within one server process
+extraction_cache = ExtractionCache()
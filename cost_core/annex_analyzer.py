@@ -0,0 +1,435 @@
+import re
+import time
+import hashlib
+from typing import Dict, List, Tuple, Any
+import numpy as np
+from .term_matcher import TermMatcher
+from .analysis_cache import LRUCache
+from .section_index import SectionIndex
+from .frameworks import load_frameworks
+
+# Indicator terms per assessment family and criterion: (terms, points per distinct term present)
+ASSESSMENT_LEXICONS = {
+    "excellence_criteria_assessment": {
+        "scientific_innovation": (["breakthrough", "novel", "innovative", "cutting-edge", "revolutionary", "paradigm", "transformative"], 2),
+        "technological_advancement": (["technology", "digital", "advanced", "state-of-art", "sophisticated", "emerging"], 1),
+        "networking_value_add": (["collaboration", "networking", "synergy", "complementary", "collective", "joint"], 1),
+        "interdisciplinary_approach": (["interdisciplinary", "multidisciplinary", "transdisciplinary", "cross-sector", "holistic"], 2),
+        "open_science_commitment": (["open access", "open data", "transparent", "reproducible", "fair principles"], 1)
+    },
+    "impact_criteria_assessment": {
+        "societal_impact": (["society", "citizen", "community", "social", "public", "quality of life"], 1),
+        "economic_impact": (["economic", "market", "industry", "commercial", "business", "economic value"], 1),
+        "scientific_impact": (["knowledge", "research", "scientific", "discovery", "understanding"], 1),
+        "stakeholder_engagement": (["stakeholder", "industry", "policy", "end-user", "partner"], 1),
+        "un_sdg_alignment": (["sustainable", "sustainability", "sdg", "environment", "climate", "equality"], 1)
+    },
+    "implementation_criteria_assessment": {
+        "project_management": (["management", "governance", "leadership", "coordination", "oversight"], 1),
+        "timeline_milestone_realism": (["timeline", "milestone", "schedule", "year", "month", "deadline"], 1),
+        "resource_allocation": (["budget", "resource", "funding", "allocation", "investment"], 1),
+        "network_coordination": (["coordination", "communication", "collaboration", "integration"], 1),
+        "risk_management": (["risk", "mitigation", "contingency", "challenge", "uncertainty"], 1)
+    },
+    "policy_compliance_assessment": {
+        "inclusiveness_demonstration": (["itc", "inclusiveness", "geographic", "diversity", "participation"], 1),
+        "gender_equality_commitment": (["gender", "female", "women", "equality", "balance"], 1),
+        "young_researcher_integration": (["young", "early career", "phd", "postdoc", "researcher"], 1),
+        "research_integrity": (["ethical", "integrity", "responsible", "original", "honest"], 1)
+    },
+    "strategic_priority_alignment": {
+        "excellence_promotion": (["excellence", "quality", "best practice", "innovation", "leadership"], 1),
+        "interdisciplinary_research": (["interdisciplinary", "multidisciplinary", "cross-disciplinary", "holistic"], 2),
+        "young_researcher_empowerment": (["empowerment", "development", "career", "mentorship", "training"], 1)
+    },
+    "content_quality_metrics": {
+        "specificity": (["specifically", "precisely", "exactly", "particular"], 1),
+        "evidence_strength": (["evidence", "demonstrate", "prove", "show", "indicate", "research shows"], 1),
+        "innovation_language": (["innovative", "novel", "breakthrough", "cutting-edge", "revolutionary"], 1),
+        "networking_rationale": (["collaboration", "network", "partnership", "synergy", "collective"], 1),
+        "impact_demonstration": (["impact", "benefit", "value", "contribution", "advancement"], 1)
+    },
+    "improvement_flags": {
+        "weak_language": (["try", "hope", "might", "could", "perhaps", "maybe"], 1),
+        "vague_quantifiers": (["some", "various", "several", "many", "different"], 1),
+        "innovation_language": (["breakthrough", "novel", "innovative", "cutting-edge"], 1),
+        "networking_language": (["collaboration", "network", "synergy", "partnership"], 1),
+        "evidence_language": (["demonstrate", "evidence", "research shows", "studies indicate"], 1)
+    }
+}
+
+# Compiled once per process and shared by every analyzer instance
+TERM_MATCHER = TermMatcher(ASSESSMENT_LEXICONS)
+
+# Families scored per sentence, in the order they appear in sentence analysis results
+SCORED_FAMILIES = [
+    "excellence_criteria_assessment",
+    "impact_criteria_assessment",
+    "implementation_criteria_assessment",
+    "policy_compliance_assessment",
+    "strategic_priority_alignment",
+    "content_quality_metrics"
+]
+
+# Contribution of each family's mean score to the overall sentence score
+OVERALL_SCORE_WEIGHTS = {
+    "excellence_criteria_assessment": 0.333,
+    "impact_criteria_assessment": 0.333,
+    "implementation_criteria_assessment": 0.334
+}
+
+# Bump whenever lexicons or scoring rules change so cached sentence rows are not reused
+SCORING_VERSION = "1"
+
+# Score rows of previously analysed sentences, shared by every draft uploaded to this process
+sentence_score_cache = LRUCache(max_entries=50000)
+
+def sentence_key(sentence: str) -> str:
+    """Cache key for a sentence's score row"""
+    return hashlib.sha1(f"{SCORING_VERSION}:{sentence}".encode("utf-8")).hexdigest()
+
+# A sentence runs to terminal punctuation followed by whitespace, or to a blank line
+SENTENCE_PATTERN = re.compile(r"\S(?:[^.!?\n]|\n(?!\s*\n)|[.!?](?!\s))*[.!?]*")
+MIN_SENTENCE_WORDS = 3
+
+def split_sentences(text: str) -> List[Tuple[int, str]]:
+    """Split text into (character_offset, sentence) pairs with whitespace normalised"""
+    sentences = []
+    for match in SENTENCE_PATTERN.finditer(text):
+        sentence = " ".join(match.group(0).split())
+        if len(sentence.split()) >= MIN_SENTENCE_WORDS:
+            sentences.append((match.start(), sentence))
+    return sentences
+
+class SentenceBatchResult:
+    """Score matrix for a batch of sentences; per-sentence dicts are built only on request"""
+
+    def __init__(self, analyzer, sentences: List[str], sections: List[str], scores: np.ndarray,
+                 reused_count: int = 0):
+        self.analyzer = analyzer
+        self.sentences = sentences
+        self.sections = sections
+        # Sentences whose scores came from the sentence score cache
+        self.reused_count = reused_count
+        
+        scored_columns = [i for i, (family, _) in enumerate(TERM_MATCHER.columns) if family in SCORED_FAMILIES]
+        flag_columns = [i for i, (family, _) in enumerate(TERM_MATCHER.columns) if family == "improvement_flags"]
+        self.criteria = [TERM_MATCHER.columns[i] for i in scored_columns]
+        self.matrix = scores[:, scored_columns]
+        self.flags = scores[:, flag_columns] > 0
+        
+        # Each overall-score family contributes weight * mean of its columns
+        column_weights = np.zeros(len(self.criteria))
+        for family, weight in OVERALL_SCORE_WEIGHTS.items():
+            family_columns = [i for i, (name, _) in enumerate(self.criteria) if name == family]
+            column_weights[family_columns] = weight / len(family_columns)
+        self.overall_scores = self.matrix @ column_weights
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def family_scores(self, family: str) -> np.ndarray:
+        """Columns of the score matrix belonging to one assessment family"""
+        return self.matrix[:, [i for i, (name, _) in enumerate(self.criteria) if name == family]]
+
+    def row(self, index: int) -> Dict:
+        """Materialise the full analysis dict for one sentence"""
+        sentence = self.sentences[index]
+        section = self.sections[index]
+        term_scores = {family: {} for family in SCORED_FAMILIES}
+        for (family, criterion), score in zip(self.criteria, self.matrix[index]):
+            term_scores[family][criterion] = int(score)
+        term_scores["improvement_flags"] = {
+            criterion: bool(flag)
+            for (_, criterion), flag in zip(
+                [column for column in TERM_MATCHER.columns if column[0] == "improvement_flags"],
+                self.flags[index]
+            )
+        }
+        
+        result = {
+            "sentence_metadata": {
+                "text": sentence,
+                "section": section,
+                "position": index + 1,
+                "word_count": len(sentence.split()),
+                "character_count": len(sentence)
+            }
+        }
+        result.update({family: term_scores[family] for family in SCORED_FAMILIES})
+        result["improvement_recommendations"] = self.analyzer._generate_sentence_improvements(sentence, section, term_scores)
+        result["overall_score"] = float(self.overall_scores[index])
+        return result
+
+class TechnicalAnnexComprehensiveAnalyzer:
+    def __init__(self):
+        # Complete evaluation framework based on ALL COST 2025 requirements and the sentence
+        # evaluation matrix, both read-only and parsed once per process from the data file
+        frameworks = load_frameworks()
+        self.evaluation_framework = frameworks.evaluation_framework
+        self.sentence_evaluation_matrix = frameworks.sentence_evaluation_matrix
+
+    def create_comprehensive_analysis_plan(self) -> Dict:
+        """Create detailed analysis plan for technical annex evaluation"""
+        return {
+            "phase_1_document_parsing": {
+                "tasks": [
+                    "Extract and structure all text content",
+                    "Identify section boundaries and headers",
+                    "Parse sentences and paragraphs systematically",
+                    "Create sentence-to-section mapping",
+                    "Generate document structure analysis"
+                ],
+                "deliverables": [
+                    "Structured text database",
+                    "Section content mapping",
+                    "Sentence inventory with metadata",
+                    "Document structure visualization"
+                ]
+            },
+            "phase_2_requirement_mapping": {
+                "tasks": [
+                    "Map each sentence to evaluation criteria",
+                    "Identify requirement coverage gaps",
+                    "Assess policy compliance per sentence",
+                    "Evaluate strategic priority alignment",
+                    "Create comprehensive coverage matrix"
+                ],
+                "deliverables": [
+                    "Sentence-to-requirement mapping database",
+                    "Coverage gap analysis report",
+                    "Compliance assessment matrix",
+                    "Strategic alignment evaluation"
+                ]
+            },
+            "phase_3_content_quality_assessment": {
+                "tasks": [
+                    "Evaluate each sentence for content quality",
+                    "Assess innovation and breakthrough language",
+                    "Analyze evidence strength and specificity",
+                    "Evaluate networking rationale quality",
+                    "Assess impact demonstration effectiveness"
+                ],
+                "deliverables": [
+                    "Sentence quality scores database",
+                    "Content strength analysis report",
+                    "Language effectiveness assessment",
+                    "Evidence quality evaluation"
+                ]
+            },
+            "phase_4_gap_analysis": {
+                "tasks": [
+                    "Identify missing content areas",
+                    "Assess weak coverage sections",
+                    "Evaluate competitive positioning",
+                    "Analyze improvement opportunities",
+                    "Generate prioritized recommendations"
+                ],
+                "deliverables": [
+                    "Comprehensive gap analysis report",
+                    "Improvement priority matrix",
+                    "Competitive positioning assessment",
+                    "Strategic enhancement recommendations"
+                ]
+            },
+            "phase_5_optimization_recommendations": {
+                "tasks": [
+                    "Generate sentence-level improvements",
+                    "Propose section enhancement strategies",
+                    "Develop content strengthening plans",
+                    "Create implementation roadmap",
+                    "Provide success probability assessment"
+                ],
+                "deliverables": [
+                    "Detailed improvement recommendations",
+                    "Content optimization strategies",
+                    "Implementation timeline",
+                    "Success probability forecast"
+                ]
+            }
+        }
+
+    def analyze_sentence_against_all_criteria(self, sentence: str, section: str, position: int) -> Dict:
+        """Comprehensive sentence analysis against all COST requirements"""
+        # One scan of the sentence feeds every assessment family
+        term_scores = self._score_terms(sentence)
+        
+        analysis_result = {
+            "sentence_metadata": {
+                "text": sentence,
+                "section": section,
+                "position": position,
+                "word_count": len(sentence.split()),
+                "character_count": len(sentence)
+            },
+            "excellence_criteria_assessment": self._assess_excellence_criteria(sentence, term_scores),
+            "impact_criteria_assessment": self._assess_impact_criteria(sentence, term_scores),
+            "implementation_criteria_assessment": self._assess_implementation_criteria(sentence, term_scores),
+            "policy_compliance_assessment": self._assess_policy_compliance(sentence, term_scores),
+            "strategic_priority_alignment": self._assess_strategic_priorities(sentence, term_scores),
+            "content_quality_metrics": self._assess_content_quality(sentence, term_scores),
+            "improvement_recommendations": self._generate_sentence_improvements(sentence, section, term_scores),
+            "overall_score": 0  # Will be calculated
+        }
+        
+        # Calculate overall score
+        analysis_result["overall_score"] = self._calculate_overall_sentence_score(analysis_result)
+        
+        return analysis_result
+
+    def analyze_sentences_batch(self, sentences: List[str], sections: List[str],
+                                score_cache: LRUCache = None) -> SentenceBatchResult:
+        """Score many sentences at once into a (sentences x criteria) matrix"""
+        if score_cache is None:
+            return SentenceBatchResult(self, sentences, sections, self._score_matrix(sentences))
+        
+        # Only sentences not seen before are scored; unchanged ones reuse their cached rows
+        keys = [sentence_key(sentence) for sentence in sentences]
+        rows = [score_cache.get(key) for key in keys]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        if missing:
+            fresh_scores = self._score_matrix([sentences[i] for i in missing])
+            for i, row in zip(missing, fresh_scores):
+                rows[i] = row
+                # A row view would keep the whole batch matrix alive for as long as the entry is cached
+                score_cache.put(keys[i], row.copy())
+        
+        if rows:
+            scores = np.vstack(rows)
+        else:
+            scores = np.zeros((0, len(TERM_MATCHER.columns)), dtype=np.int32)
+        return SentenceBatchResult(self, sentences, sections, scores, reused_count=len(rows) - len(missing))
+
+    def _score_matrix(self, sentences: List[str]) -> np.ndarray:
+        """Raw score matrix over every matcher column, including the specificity number bonus"""
+        scores = TERM_MATCHER.score_matrix(sentences)
+        
+        # Specificity bonus for concrete numbers, applied to the whole column at once
+        specificity = TERM_MATCHER.columns.index(("content_quality_metrics", "specificity"))
+        has_digit = np.fromiter((any(char.isdigit() for char in sentence) for sentence in sentences),
+                                dtype=bool, count=len(sentences))
+        scores[:, specificity] = np.minimum(5, scores[:, specificity] + 2 * has_digit)
+        return scores
+
+    def analyze_document(self, text: str, score_cache: LRUCache = sentence_score_cache) -> Dict:
+        """Split a full annex into sentences, map them to mandatory sections and score them all"""
+        started = time.perf_counter()
+        
+        sentences = split_sentences(text)
+        section_index = SectionIndex(
+            text, self.evaluation_framework["technical_format_requirements"]["mandatory_sections"]
+        )
+        sections = section_index.sections_for([offset for offset, _ in sentences])
+        
+        batch = self.analyze_sentences_batch([sentence for _, sentence in sentences], sections, score_cache)
+        
+        # Section and document aggregates are recomputed from the per-sentence rows
+        section_names = list(dict.fromkeys(sections))
+        section_ids = {name: i for i, name in enumerate(section_names)}
+        row_sections = np.fromiter((section_ids[name] for name in sections), dtype=np.intp, count=len(sections))
+        sentence_counts = np.bincount(row_sections, minlength=len(section_names))
+        score_sums = np.bincount(row_sections, weights=batch.overall_scores, minlength=len(section_names))
+        
+        section_summary = {
+            name: {
+                "sentence_count": int(sentence_counts[i]),
+                "mean_overall_score": float(score_sums[i] / sentence_counts[i])
+            }
+            for i, name in enumerate(section_names)
+        }
+        
+        elapsed = time.perf_counter() - started
+        return {
+            "batch": batch,
+            "document_score": float(batch.overall_scores.mean()) if len(batch) else 0.0,
+            "reused_sentences": batch.reused_count,
+            "offsets": [offset for offset, _ in sentences],
+            "sections_detected": section_index.titles,
+            "section_summary": section_summary,
+            "elapsed_seconds": elapsed,
+            "sentences_per_second": len(sentences) / elapsed if elapsed > 0 else 0.0
+        }
+
+    def _score_terms(self, text: str) -> Dict:
+        """Scan text once against all assessment lexicons"""
+        return TERM_MATCHER.score(TERM_MATCHER.scan(text))
+
+    def count_criterion_hits(self, text: str) -> Dict:
+        """Per-criterion term occurrence counts for a sentence or a whole document"""
+        return TERM_MATCHER.hit_counts(TERM_MATCHER.scan(text))
+
+    def _assess_excellence_criteria(self, sentence: str, term_scores: Dict = None) -> Dict:
+        """Assess sentence against excellence criteria"""
+        term_scores = term_scores or self._score_terms(sentence)
+        return dict(term_scores["excellence_criteria_assessment"])
+
+    def _assess_impact_criteria(self, sentence: str, term_scores: Dict = None) -> Dict:
+        """Assess sentence against impact criteria"""
+        term_scores = term_scores or self._score_terms(sentence)
+        return dict(term_scores["impact_criteria_assessment"])
+
+    def _assess_implementation_criteria(self, sentence: str, term_scores: Dict = None) -> Dict:
+        """Assess sentence against implementation criteria"""
+        term_scores = term_scores or self._score_terms(sentence)
+        return dict(term_scores["implementation_criteria_assessment"])
+
+    def _assess_policy_compliance(self, sentence: str, term_scores: Dict = None) -> Dict:
+        """Assess sentence against policy compliance requirements"""
+        term_scores = term_scores or self._score_terms(sentence)
+        return dict(term_scores["policy_compliance_assessment"])
+
+    def _assess_strategic_priorities(self, sentence: str, term_scores: Dict = None) -> Dict:
+        """Assess sentence alignment with COST strategic priorities"""
+        term_scores = term_scores or self._score_terms(sentence)
+        return dict(term_scores["strategic_priority_alignment"])
+
+    def _assess_content_quality(self, sentence: str, term_scores: Dict = None) -> Dict:
+        """Assess overall content quality metrics"""
+        term_scores = term_scores or self._score_terms(sentence)
+        assessment = dict(term_scores["content_quality_metrics"])
+        
+        # Specificity bonus for concrete numbers
+        if any(char.isdigit() for char in sentence):
+            assessment["specificity"] = min(5, assessment["specificity"] + 2)
+        
+        return assessment
+
+    def _generate_sentence_improvements(self, sentence: str, section: str, term_scores: Dict = None) -> List[str]:
+        """Generate specific improvement recommendations for sentence"""
+        term_scores = term_scores or self._score_terms(sentence)
+        flags = term_scores["improvement_flags"]
+        improvements = []
+        
+        # Check for weak language
+        if flags["weak_language"]:
+            improvements.append("Replace weak language with confident, assertive statements")
+        
+        # Check for vague terms
+        if flags["vague_quantifiers"]:
+            improvements.append("Replace vague quantifiers with specific numbers or ranges")
+        
+        # Check for innovation language
+        if not flags["innovation_language"] and section in ["State-of-the-art", "Impact"]:
+            improvements.append("Add innovation-focused language to emphasize breakthrough potential")
+        
+        # Check for networking rationale
+        if not flags["networking_language"] and "networking" in section.lower():
+            improvements.append("Strengthen networking rationale with specific collaboration benefits")
+        
+        # Check for evidence
+        if not flags["evidence_language"]:
+            improvements.append("Add evidence-based language to strengthen credibility")
+        
+        return improvements
+
+    def _calculate_overall_sentence_score(self, analysis_result: Dict) -> float:
+        """Calculate overall sentence score based on all assessments"""
+        scores = []
+        
+        # Excellence (33.3%), impact (33.3%) and implementation (33.4%) criteria
+        for family, weight in OVERALL_SCORE_WEIGHTS.items():
+            family_scores = list(analysis_result[family].values())
+            family_avg = np.mean(family_scores) if family_scores else 0
+            scores.append(family_avg * weight)
+        
+        return sum(scores)
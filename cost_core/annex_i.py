@@ -0,0 +1,306 @@
+"""Build step: parse the official Annex I country and organisations table into lookup data files
+
+Run:  python -m cost_core.annex_i ["Documents for the Open Call/Annex-I-...-Version-1.7.rtf"]
+The RTF edition is parsed because its tables keep each organisation name and acronym in separate cells.
+Regenerate the data files whenever a new Annex I version is published, and commit them.
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List
+from .rtf_text import parse_rtf
+
+ANNEX_I_FORMAT_VERSION = 2
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+ORGANISATIONS_PATH = os.path.join(DATA_DIR, "annex_i_organisations.json")
+COUNTRIES_PATH = os.path.join(DATA_DIR, "annex_i_countries.json")
+DEFAULT_SOURCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "Documents for the Open Call",
+    "Annex-I-level-A-Country-and-Organisations-Table-Version-1.7.rtf"
+)
+
+# Bold headings of the "COUNTRIES" part and the COST status of the countries listed under them
+COUNTRY_STATUSES = {
+    "cost full members": "full_member",
+    "shall be considered as affiliated to a legal entity in a cost full member the following": "outermost_region",
+    "cost cooperating member": "cooperating_member",
+    "cost partner member": "partner_member",
+    "cost near neighbour countries": "near_neighbour"
+}
+ITC_HEADING = "cost inclusiveness target countries"
+# Countries not listed in Annex I are International Partner Countries
+DEFAULT_COUNTRY_STATUS = "international_partner"
+# Footnotes are set in a smaller font than the country lists they interrupt
+BODY_TEXT_SIZE = 10
+
+# Annex I gives names only; codes are ISO 3166-1 alpha-2 (XK for Kosovo), or ISO 3166-2 for regions
+# without their own alpha-2 code. The build fails on a listed country missing from this table.
+COUNTRY_ISO_CODES = {
+    "Albania": "AL", "Armenia": "AM", "Austria": "AT", "Belgium": "BE", "Bosnia and Herzegovina": "BA",
+    "Bulgaria": "BG", "Croatia": "HR", "Cyprus": "CY", "Czech Republic": "CZ", "Denmark": "DK", "Estonia": "EE",
+    "Finland": "FI", "France": "FR", "Georgia": "GE", "Germany": "DE", "Greece": "GR", "Hungary": "HU",
+    "Iceland": "IS", "Ireland": "IE", "Italy": "IT", "Latvia": "LV", "Lithuania": "LT", "Luxembourg": "LU",
+    "Malta": "MT", "Republic of Moldova": "MD", "Montenegro": "ME", "Netherlands": "NL",
+    "Republic of North Macedonia": "MK", "Norway": "NO", "Poland": "PL", "Portugal": "PT", "Romania": "RO",
+    "Serbia": "RS", "Slovakia": "SK", "Slovenia": "SI", "Spain": "ES", "Sweden": "SE", "Switzerland": "CH",
+    "Türkiye": "TR", "Ukraine": "UA", "United Kingdom": "GB",
+    "French Guiana": "GF", "Guadeloupe": "GP", "Martinique": "MQ", "Mayotte": "YT", "Reunion Island": "RE",
+    "Saint-Martin": "MF", "Azores": "PT-20", "Madeira": "PT-30", "Canary Islands": "ES-CN",
+    "Israel": "IL", "South Africa": "ZA",
+    "Algeria": "DZ", "Azerbaijan": "AZ", "Belarus": "BY", "Egypt": "EG", "Faroe Islands": "FO", "Jordan": "JO",
+    "Kosovo": "XK", "Lebanon": "LB", "Libya": "LY", "Morocco": "MA", "Palestine": "PS", "Russia": "RU",
+    "Syria": "SY", "Tunisia": "TN"
+}
+# Other names the same country goes by, in Annex I itself or in participant rosters
+COUNTRY_ALIASES = {
+    "Bosnia and Herzegovina": ["Bosnia & Herzegovina"],
+    "Czech Republic": ["Czechia"],
+    "Greece": ["Hellenic Republic", "EL"],
+    "Republic of Moldova": ["Moldova"],
+    "Netherlands": ["Holland"],
+    "Republic of North Macedonia": ["North Macedonia", "Macedonia"],
+    "Slovakia": ["Slovak Republic"],
+    "Türkiye": ["Turkey", "Republic of Türkiye"],
+    "United Kingdom": ["UK", "Great Britain", "United Kingdom of Great Britain and Northern Ireland"],
+    "Reunion Island": ["Réunion", "Reunion"],
+    "Saint-Martin": ["Saint Martin"],
+    "Azores": ["Açores"],
+    "Canary Islands": ["Canaries"],
+    "Russia": ["Russian Federation"],
+    "Syria": ["Syrian Arab Republic"],
+    "Palestine": ["State of Palestine"]
+}
+
+# Bold headings of the "SPECIFIC ORGANISATIONS" part and the category their entries belong to
+ORGANISATION_CATEGORIES = {
+    "eu institutions, bodies, offices and agencies": "eu_body",
+    "european rtd organisations": "european_rtd_organisation",
+    "international organisations": "international_organisation"
+}
+ERIC_HEADING = "european research infrastructure consortia"
+# Parenthetical remarks that qualify a name rather than give another name for it
+QUALIFIER_PREFIXES = ("and ",)
+
+
+def _heading_key(text: str) -> str:
+    """Lowercase heading without its trailing colon or bracketed abbreviation"""
+    return re.sub(r"\s*\([^)]*\)$", "", text.rstrip(": ")).lower()
+
+
+def _split_name(raw: str) -> Dict:
+    """Separate a table name cell into its main name and the aliases given in brackets or quotes"""
+    aliases = []
+    for remark in re.findall(r"\(([^)]*)\)", raw):
+        if not remark.lower().startswith(QUALIFIER_PREFIXES):
+            aliases.append(re.sub(r"^the\s+", "", remark.strip(), flags=re.IGNORECASE))
+    aliases += re.findall(r"'([^']+)'$", raw)
+    name = re.sub(r"\([^)]*\)|'[^']+'$", " ", raw)
+    # "Agency for the Space Programme : European GNSS Agency" lists a former name after the colon
+    names = [" ".join(part.split()) for part in name.split(" : ")]
+    return {"name": names[0], "aliases": [alias for alias in names[1:] + aliases if alias]}
+
+
+def _split_acronyms(raw: str) -> List[str]:
+    return [" ".join(part.split()) for part in raw.split("/") if part.strip()]
+
+
+@lru_cache(maxsize=4096)
+def country_key(name: str) -> str:
+    """Lookup key for a country name or code: case, accents, spacing and a leading "the" are ignored"""
+    name = unicodedata.normalize("NFKD", " ".join(str(name).split()))
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    return re.sub(r"^the\s+", "", name, flags=re.IGNORECASE).casefold()
+
+
+def _split_country_list(text: str) -> List[Dict]:
+    """Country names of an Annex I list; bracketed names are countries with suspended cooperation
+
+    "X and Y" is only split when it is not itself a country name, keeping "Bosnia and Herzegovina" whole.
+    """
+    known = {country_key(name): name for name in COUNTRY_ISO_CODES}
+    for name, aliases in COUNTRY_ALIASES.items():
+        known.update({country_key(alias): name for alias in aliases})
+    entries = []
+    for item in text.rstrip(". ").split(","):
+        item = re.sub(r"^\s*and\s+", "", item).strip()
+        parts = [item] if country_key(item.strip("[]")) in known else re.split(r"\s+and\s+", item)
+        for part in parts:
+            part = part.strip()
+            if not part:
+                continue
+            name = part.strip("[]")
+            if country_key(name) not in known:
+                raise ValueError(f"Annex I lists {name!r}, which has no ISO code in COUNTRY_ISO_CODES")
+            entries.append({"name": known[country_key(name)], "suspended": part.startswith("[")})
+    return entries
+
+
+def _grouped_regions(text: str) -> List[Dict]:
+    """Outermost regions, each with the parent country named after its group in brackets"""
+    regions = []
+    for names, parent in re.findall(r"([^()]+)\(([^)]+)\)", text):
+        for entry in _split_country_list(names.strip(" ,")):
+            entry["parent"] = parent
+            regions.append(entry)
+    return regions
+
+
+def parse_countries(blocks: List[Dict]) -> List[Dict]:
+    """Countries listed under "COUNTRIES" with their COST status, ITC flag, ISO code and aliases"""
+    entries = []
+    itc_names = set()
+    status = None
+    list_text = ""
+    in_itc_table = False
+
+    def flush():
+        nonlocal list_text
+        if list_text:
+            if status == "outermost_region":
+                found = _grouped_regions(list_text)
+            else:
+                found = _split_country_list(list_text)
+            entries.extend({**entry, "status": status} for entry in found)
+        list_text = ""
+
+    for block in blocks:
+        if block["kind"] == "paragraph" and _heading_key(block["text"]) == "specific organisations":
+            break
+        if block["size"] is not None and block["size"] < BODY_TEXT_SIZE:
+            continue
+        if block["kind"] == "row":
+            # Header row, then one row whose cells list the EU, outermost region and non-EU ITCs
+            if in_itc_table and "," in block["cells"][0]:
+                for cell in block["cells"]:
+                    if "(" in cell:
+                        itc_names.update(entry["name"] for entry in _grouped_regions(cell))
+                    else:
+                        itc_names.update(entry["name"] for entry in _split_country_list(cell))
+            continue
+        text = block["text"]
+        key = _heading_key(text)
+        if block["bold"]:
+            flush()
+            status = COUNTRY_STATUSES.get(key)
+            in_itc_table = key == ITC_HEADING
+            continue
+        if status is None or text.isdigit():
+            # Explanatory notes and stray page numbers between list paragraphs
+            continue
+        if status == "outermost_region" and "(" not in text:
+            continue
+        # A long list can break across paragraphs mid-name, as in "Republic" / "of North Macedonia"
+        list_text = f"{list_text} {text}".strip()
+        if text.endswith(".") or status != "full_member":
+            flush()
+    flush()
+
+    countries = []
+    for entry in entries:
+        name = entry["name"]
+        countries.append({
+            "name": name,
+            "iso_code": COUNTRY_ISO_CODES[name],
+            "status": entry["status"],
+            "itc": name in itc_names,
+            "suspended": entry["suspended"],
+            "parent": entry.get("parent"),
+            "aliases": COUNTRY_ALIASES.get(name, [])
+        })
+    return countries
+
+
+def parse_organisations(blocks: List[Dict]) -> List[Dict]:
+    """Organisations listed under "SPECIFIC ORGANISATIONS", with category, table group, acronyms and aliases"""
+    organisations = []
+    category = None
+    group = None
+    in_eric_list = False
+    started = False
+    for block in blocks:
+        if block["kind"] == "paragraph":
+            key = _heading_key(block["text"])
+            if key == "specific organisations":
+                started = True
+            elif started and block["bold"] and key in ORGANISATION_CATEGORIES:
+                category = ORGANISATION_CATEGORIES[key]
+                group = None
+                in_eric_list = False
+            elif category == "european_rtd_organisation" and key == ERIC_HEADING:
+                group = block["text"]
+                in_eric_list = True
+            elif in_eric_list and key == "others":
+                group = block["text"]
+                in_eric_list = False
+            elif in_eric_list and len(block["text"].split()) <= 4:
+                # Bulleted ERIC names; the longer paragraph after the heading is an explanatory note
+                name = block["text"]
+                base = re.sub(r"[\s-]ERIC$", "", name)
+                # "CESSDA ERIC" is usually written as plain "CESSDA"; mixed-case bases like "Share" are words
+                acronyms = [base] if base != name and base.replace("-", "").isupper() else []
+                organisations.append({
+                    "name": name, "aliases": [], "acronyms": acronyms, "category": category, "group": group
+                })
+            continue
+
+        if category is None:
+            continue
+        name_cell = block["cells"][0]
+        acronym_cell = block["cells"][1] if len(block["cells"]) > 1 else ""
+        if block["bold"] and not acronym_cell:
+            group = name_cell
+            continue
+        entry = _split_name(name_cell)
+        acronyms = _split_acronyms(acronym_cell)
+        entry["aliases"] = [alias for alias in entry["aliases"] if alias not in acronyms]
+        entry.update({"acronyms": acronyms, "category": category, "group": group})
+        organisations.append(entry)
+    return organisations
+
+
+def build_data_files(source: str = DEFAULT_SOURCE) -> Dict[str, int]:
+    """Parse the Annex I RTF and rewrite the data files, returning how many records each one holds"""
+    with open(source, "rb") as handle:
+        data = handle.read()
+    blocks = parse_rtf(data.decode("latin-1"))
+    provenance = {
+        "format_version": ANNEX_I_FORMAT_VERSION,
+        "source": os.path.basename(source),
+        "source_sha256": hashlib.sha256(data).hexdigest()
+    }
+
+    from .institutions import compile_index
+
+    countries = parse_countries(blocks)
+    organisations = parse_organisations(blocks)
+    # The organisations file also carries the compiled trie pattern, so loading it never rebuilds the trie
+    outputs = {
+        COUNTRIES_PATH: ({"countries": countries}, len(countries)),
+        ORGANISATIONS_PATH: ({"organisations": organisations, "index": compile_index(organisations)}, len(organisations))
+    }
+    for path, (payload, _) in outputs.items():
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({**provenance, **payload}, handle, indent=1, ensure_ascii=False)
+            handle.write("\n")
+    return {path: count for path, (_, count) in outputs.items()}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate the Annex I lookup data files")
+    parser.add_argument("source", nargs="?", default=DEFAULT_SOURCE, help="Annex I country and organisations table (RTF)")
+    args = parser.parse_args(argv)
+
+    for path, count in build_data_files(args.source).items():
+        print(f"Wrote {count} records to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+from typing import Dict, List, Tuple, Union
+from .frameworks import load_frameworks, SentenceRecord
+
+class ActualCOSTDocumentAnalyzer:
+    def __init__(self):
+        # Actual content from the original COST Mission and Policies document, shared read-only records
+        self.actual_document_content = load_frameworks().actual_document_content
+
+    def get_actual_strategic_insights(self) -> Dict:
+        """Extract strategic insights from actual document content"""
+        return {
+            "overall_strategy": {
+                "primary_approach": "Excellence Through Exceptional Inclusiveness",
+                "positioning": "Sustainability-focused digital finance innovation with maximum inclusiveness",
+                "credibility_building": "Specific metrics, existing achievements, concrete commitments",
+                "risk_mitigation": "Multiple compliance dimensions, verifiable statistics, systematic implementation"
+            },
+            "numerical_brilliance": {
+                "58_percent_itc": "16% above minimum - demonstrates serious commitment without tokenism",
+                "92_percent_coverage": "Near-universal ITC engagement suggests exceptional appeal",
+                "50_percent_pattern": "Consistent 50% across leadership, funding, participation",
+                "45_percent_youth": "Substantial empowerment without compromising experience",
+                "40_percent_industry": "Ambitious but realistic industry engagement target"
+            },
+            "language_mastery": {
+                "cost_terminology": "Cross-border collaboration, networking, dissemination - exact COST language",
+                "commitment_language": "Reserved, allocated, will be - strong commitment terms",
+                "evidence_language": "Currently, already, substantial - present achievement focus",
+                "strategic_language": "Actively monitored, systematically, comprehensive - professional approach"
+            },
+            "structural_genius": {
+                "dual_pillar_opening": "Excellence AND inclusiveness as equal foundations",
+                "front_loading": "Strongest metric (58%) in opening sentences",
+                "escalating_commitment": "Participation → Leadership → Grant Holder (ultimate authority)",
+                "resource_backing": "Not just positions but funding allocation (50% of funds)"
+            }
+        }
+
+    def analyze_actual_sentence_effectiveness(self, sentence: Union[SentenceRecord, Dict]) -> Dict:
+        """Analyze effectiveness of actual sentences from the document"""
+        if isinstance(sentence, dict):
+            sentence = SentenceRecord.from_dict(sentence)
+        effectiveness_score = 0
+        factors = []
+        text = sentence.lowered
+        
+        # Numerical evidence bonus
+        if sentence.has_digits:
+            effectiveness_score += 25
+            factors.append("Contains specific numerical evidence")
+        
+        # COST terminology bonus
+        cost_terms = ["cross-border", "networking", "dissemination", "itc", "inclusiveness", "excellence"]
+        if any(term in text for term in cost_terms):
+            effectiveness_score += 20
+            factors.append("Uses official COST terminology")
+        
+        # Commitment strength bonus
+        strong_terms = ["will", "allocated", "reserved", "committed", "established"]
+        if any(term in text for term in strong_terms):
+            effectiveness_score += 15
+            factors.append("Strong commitment language")
+        
+        # Present achievement bonus
+        achievement_terms = ["currently", "already", "substantial", "existing"]
+        if any(term in text for term in achievement_terms):
+            effectiveness_score += 15
+            factors.append("Demonstrates existing achievements")
+        
+        # Specificity bonus
+        specific_terms = ["50%", "58%", "92%", "45%", "40%", "six months"]
+        if any(term in sentence.text for term in specific_terms):
+            effectiveness_score += 20
+            factors.append("Highly specific commitments")
+        
+        # Length assessment
+        word_count = sentence.word_count
+        if word_count > 35:
+            effectiveness_score -= 10
+            factors.append("Sentence complexity may reduce impact")
+        
+        return {
+            "score": min(100, effectiveness_score),
+            "factors": factors,
+            "word_count": word_count,
+            "character_count": sentence.character_count
+        }
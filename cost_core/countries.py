@@ -0,0 +1,81 @@
+import json
+from functools import lru_cache
+from typing import Dict, List, Optional
+from .annex_i import ANNEX_I_FORMAT_VERSION, COUNTRIES_PATH, DEFAULT_COUNTRY_STATUS, country_key
+
+STATUS_LABELS = {
+    "full_member": "COST Full Member",
+    "outermost_region": "EU Outermost Region",
+    "cooperating_member": "COST Cooperating Member",
+    "partner_member": "COST Partner Member",
+    "near_neighbour": "Near Neighbour Country",
+    "international_partner": "International Partner Country"
+}
+# Statuses whose countries count toward the minimum number of participating COST Members
+MEMBER_STATUSES = ("full_member", "cooperating_member")
+
+
+class CountryIndex:
+    """Annex I countries keyed by every name, alias and ISO code, so each classification is one dict lookup"""
+
+    def __init__(self, countries: List[Dict]):
+        self.countries = countries
+        self._by_key = {}
+        for country in countries:
+            for name in [country["name"], country["iso_code"]] + country["aliases"]:
+                self._by_key.setdefault(country_key(name), country)
+        self._itc_keys = frozenset(key for key, country in self._by_key.items() if country["itc"])
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    def __contains__(self, name: str) -> bool:
+        return country_key(name) in self._by_key
+
+    def lookup(self, name: str) -> Optional[Dict]:
+        """Annex I record for a country name, alias or ISO code, or None when Annex I does not list it"""
+        return self._by_key.get(country_key(name))
+
+    def classify(self, name: str) -> Dict:
+        """COST status of a country; countries Annex I does not list are International Partner Countries"""
+        country = self.lookup(name)
+        if country is None:
+            return {
+                "name": str(name).strip(), "iso_code": None, "status": DEFAULT_COUNTRY_STATUS,
+                "itc": False, "suspended": False, "parent": None, "aliases": [], "listed": False
+            }
+        return {**country, "listed": True}
+
+    def is_itc(self, name: str) -> bool:
+        return country_key(name) in self._itc_keys
+
+    def member_country(self, name: str) -> Optional[str]:
+        """COST Full or Cooperating Member a country counts for: itself, or the parent of an EU Outermost Region"""
+        country = self.lookup(name)
+        if country is not None and country["parent"]:
+            country = self.lookup(country["parent"])
+        return country["name"] if country is not None and country["status"] in MEMBER_STATUSES else None
+
+    def canonical_name(self, name: str) -> str:
+        """Annex I spelling of a listed country, or the name as given"""
+        country = self.lookup(name)
+        return country["name"] if country else str(name).strip()
+
+    def names(self, status: str = None, itc: bool = None) -> List[str]:
+        """Country names in Annex I order, optionally filtered by status and ITC flag"""
+        return [
+            country["name"] for country in self.countries
+            if (status is None or country["status"] == status) and (itc is None or country["itc"] == itc)
+        ]
+
+
+@lru_cache(maxsize=None)
+def load_country_index(path: str = COUNTRIES_PATH) -> CountryIndex:
+    """Country lookup generated from Annex I, loaded once per process"""
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    if data.get("format_version") != ANNEX_I_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported Annex I data format {data.get('format_version')!r}, expected {ANNEX_I_FORMAT_VERSION}"
+        )
+    return CountryIndex(data["countries"])
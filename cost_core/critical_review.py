@@ -0,0 +1,121 @@
+from typing import Dict, List, Tuple
+from .frameworks import load_frameworks
+
+class COSTCriticalReviewer:
+    def __init__(self):
+        # Comprehensive critical analysis of the original document, shared read-only records
+        self.critical_review = load_frameworks().critical_review
+
+    def get_overall_assessment(self) -> Dict:
+        """Provide overall critical assessment"""
+        return {
+            "overall_grade": "B+ (Good with significant improvement potential)",
+            "core_strengths": [
+                "Exceptional compliance metrics and systematic approach",
+                "Strong implementation feasibility and track record",
+                "Sophisticated understanding of COST ecosystem",
+                "Multi-dimensional diversity strategy"
+            ],
+            "critical_vulnerabilities": [
+                "Missing interdisciplinary research content (Section 5.2)",
+                "Insufficient innovation and breakthrough science emphasis",
+                "Over-reliance on compliance rather than vision",
+                "Underdeveloped research area positioning"
+            ],
+            "competitive_position": "Strong on implementation, weak on innovation",
+            "success_probability": "65% - Strong foundation but needs innovation boost",
+            "key_recommendations": [
+                "URGENT: Develop Section 5.2 with compelling interdisciplinary narrative",
+                "Add breakthrough science and innovation language throughout",
+                "Strengthen sustainable digital finance strategic positioning",
+                "Balance compliance evidence with visionary elements"
+            ]
+        }
+
+    def analyze_sentence_problems(self) -> List[Dict]:
+        """Analyze specific problematic sentences"""
+        return [
+            {
+                "sentence": "Those will be addressed as follows:",
+                "problem": "Weak transition that assumes evaluator knowledge",
+                "severity": "Minor",
+                "improvement": "Replace with: 'Our Action addresses COST's excellence and inclusiveness priorities through the following strategic commitments:'"
+            },
+            {
+                "sentence": "58% of the participating countries are ITC.",
+                "problem": "Redundant repetition within same paragraph",
+                "severity": "Minor",
+                "improvement": "Remove redundancy or rephrase as reinforcement with additional context"
+            },
+            {
+                "sentence": "One of the main objectives of our Action is to enable fruitful collaborations...",
+                "problem": "Vague language ('fruitful collaborations') lacks specificity and impact",
+                "severity": "Moderate",
+                "improvement": "Specify types of collaboration and expected breakthrough outcomes"
+            },
+            {
+                "sentence": "We envision that all conferences and workshops will have at least a 40% participation rate from industry.",
+                "problem": "'Envision' suggests aspiration rather than commitment; percentage seems arbitrary",
+                "severity": "Moderate",
+                "improvement": "Provide rationale for 40% target and strengthen commitment language"
+            },
+            {
+                "sentence": "Our Action has agreed to align all activities with the three COST strategic priorities.",
+                "problem": "Past tense 'has agreed' suggests completed action rather than ongoing commitment",
+                "severity": "Minor",
+                "improvement": "Use present/future tense: 'Our Action aligns all activities with...'"
+            }
+        ]
+
+    def get_improvement_roadmap(self) -> Dict:
+        """Provide structured improvement roadmap"""
+        return {
+            "immediate_fixes": [
+                {
+                    "issue": "Section 5.2 Complete Gap",
+                    "action": "Develop 200-300 word interdisciplinary research narrative",
+                    "timeline": "Priority 1 - Critical",
+                    "effort": "High",
+                    "impact": "Critical"
+                },
+                {
+                    "issue": "Innovation Language Deficit",
+                    "action": "Add breakthrough science terminology throughout document",
+                    "timeline": "Priority 1 - Critical", 
+                    "effort": "Medium",
+                    "impact": "High"
+                }
+            ],
+            "strategic_enhancements": [
+                {
+                    "area": "Sustainable Digital Finance Positioning",
+                    "action": "Develop comprehensive narrative connecting to EU sustainability priorities",
+                    "timeline": "Priority 2 - Important",
+                    "effort": "High",
+                    "impact": "High"
+                },
+                {
+                    "area": "Vision and Ambition Balance",
+                    "action": "Add transformative potential and breakthrough outcome statements",
+                    "timeline": "Priority 2 - Important",
+                    "effort": "Medium",
+                    "impact": "Medium"
+                }
+            ],
+            "polish_refinements": [
+                {
+                    "improvement": "Sentence Structure Optimization",
+                    "action": "Simplify complex sentences and improve flow",
+                    "timeline": "Priority 3 - Enhancement",
+                    "effort": "Low",
+                    "impact": "Low"
+                },
+                {
+                    "improvement": "Industry Partnership Specificity",
+                    "action": "Add concrete examples or commitments",
+                    "timeline": "Priority 3 - Enhancement",
+                    "effort": "Medium",
+                    "impact": "Medium"
+                }
+            ]
+        }
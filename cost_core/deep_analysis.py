@@ -0,0 +1,173 @@
+from typing import Dict, List, Tuple, Union
+from .frameworks import load_frameworks, SentenceRecord
+
+class COSTDocumentDeepAnalyzer:
+    def __init__(self):
+        # Original document structure with deep analysis, shared read-only records parsed once per process
+        self.original_document_analysis = load_frameworks().original_document_analysis
+
+    def get_strategic_insights(self) -> Dict:
+        """Extract strategic insights from the document structure"""
+        return {
+            "overall_strategy": {
+                "primary_approach": "Excellence through Exceeding Requirements",
+                "positioning": "Sophisticated compliance with deep COST ecosystem understanding",
+                "credibility_building": "Specific numbers, existing achievements, systematic planning",
+                "risk_mitigation": "Multiple compliance dimensions, detailed evidence, systematic monitoring"
+            },
+            "numerical_strategy": {
+                "58%_itc_participation": "Dramatically exceeds 50% minimum - shows serious inclusiveness commitment",
+                "92%_itc_coverage": "Near-universal ITC engagement suggests exceptional networking or existing relationships",
+                "50%_repeated_metrics": "Gender parity, ITC leadership, budget allocation - consistent 50% messaging",
+                "45%_yri_leadership": "Substantial youth empowerment without compromising senior guidance",
+                "40%_industry_participation": "Ambitious but realistic industry engagement target"
+            },
+            "language_patterns": {
+                "confidence_indicators": ["substantial", "actively", "already", "throughout", "comprehensive"],
+                "compliance_terms": ["adhere", "align", "commit", "reserve", "allocate", "maintain"],
+                "evidence_language": ["specific", "concrete", "measurable", "verifiable", "systematic"],
+                "future_commitment": ["will", "maintain", "continue", "monitor", "implement"]
+            },
+            "structural_analysis": {
+                "front_loading": "Strongest evidence (58% ITC) appears first for maximum impact",
+                "repetition_strategy": "Key metrics repeated for emphasis and memorability",
+                "detail_gradation": "More detail in stronger areas, less in weaker areas",
+                "evidence_hierarchy": "Numbers > specific commitments > general statements"
+            }
+        }
+
+    def analyze_sentence_effectiveness(self, sentence: Union[SentenceRecord, Dict]) -> Dict:
+        """Analyze individual sentence effectiveness"""
+        if isinstance(sentence, dict):
+            sentence = SentenceRecord.from_dict(sentence)
+        effectiveness_score = 0
+        factors = []
+        text = sentence.lowered
+        
+        # Specificity bonus
+        if sentence.has_digits:
+            effectiveness_score += 20
+            factors.append("Contains specific numbers")
+        
+        # Action language bonus
+        action_words = ["will", "allocate", "reserve", "maintain", "monitor", "implement"]
+        if any(word in text for word in action_words):
+            effectiveness_score += 15
+            factors.append("Uses commitment language")
+        
+        # Evidence language bonus
+        evidence_words = ["specific", "concrete", "already", "currently", "substantial"]
+        if any(word in text for word in evidence_words):
+            effectiveness_score += 15
+            factors.append("Provides evidence")
+        
+        # COST terminology bonus
+        cost_terms = ["ITC", "inclusiveness", "networking", "collaboration", "dissemination"]
+        if any(term.lower() in text for term in cost_terms):
+            effectiveness_score += 10
+            factors.append("Uses COST terminology")
+        
+        # Length penalty for overly complex sentences
+        if sentence.word_count > 30:
+            effectiveness_score -= 10
+            factors.append("Overly complex sentence")
+        
+        return {
+            "score": min(100, effectiveness_score),
+            "factors": factors,
+            "word_count": sentence.word_count,
+            "character_count": sentence.character_count
+        }
+
+    def assess_sentence_strategy(self, sentence: Union[SentenceRecord, Dict]) -> Dict:
+        """Assess strategic value of individual sentence"""
+        if isinstance(sentence, dict):
+            sentence = SentenceRecord.from_dict(sentence)
+        assessment = {
+            "credibility_building": 0,
+            "compliance_demonstration": 0,
+            "specificity_level": 0,
+            "future_commitment": 0,
+            "evidence_strength": 0
+        }
+        
+        text = sentence.lowered
+        
+        # Credibility building
+        credibility_terms = ["already", "currently", "have", "existing", "proven", "established"]
+        assessment["credibility_building"] = min(5, sum(2 for term in credibility_terms if term in text))
+        
+        # Compliance demonstration
+        compliance_terms = ["50%", "58%", "92%", "itc", "gender", "young researchers", "allocate"]
+        assessment["compliance_demonstration"] = min(5, sum(1 for term in compliance_terms if term in text))
+        
+        # Specificity level
+        if sentence.has_digits:
+            assessment["specificity_level"] += 3
+        if "specific" in text or "concrete" in text:
+            assessment["specificity_level"] += 2
+        assessment["specificity_level"] = min(5, assessment["specificity_level"])
+        
+        # Future commitment
+        future_terms = ["will", "maintain", "continue", "ensure", "monitor", "implement"]
+        assessment["future_commitment"] = min(5, sum(1 for term in future_terms if term in text))
+        
+        # Evidence strength
+        if "purpose" in sentence and ("demonstrates" in sentence["purpose"] or "proves" in sentence["purpose"]):
+            assessment["evidence_strength"] += 3
+        if sentence.has_digits:
+            assessment["evidence_strength"] += 2
+        assessment["evidence_strength"] = min(5, assessment["evidence_strength"])
+        
+        return assessment
+
+    def extract_critical_insights(self) -> Dict:
+        """Extract critical insights from the document analysis"""
+        return {
+            "strategic_brilliance": [
+                "58% ITC participation (16% above minimum) - calculated excellence strategy",
+                "Strategic repetition of key metrics for emphasis and memorability",
+                "Front-loading strongest evidence (58% ITC) for maximum evaluator impact",
+                "Grant Holder from ITC - ultimate commitment signal at highest authority level",
+                "Triple intersectionality management (ITC + female + young) shows sophisticated diversity understanding",
+                "Uses COST's own language ('cross-border collaboration, networking, dissemination') for alignment",
+                "Demonstrates existing achievements ('currently have', 'already') rather than empty promises"
+            ],
+            "strategic_weaknesses": [
+                "Section 5.2 (Interdisciplinary research) completely empty - major gap in strategic priority",
+                "Some overly complex sentences reduce clarity and impact",
+                "Missing innovation and breakthrough science language for competitive edge",
+                "Limited forward-looking vision statements beyond compliance",
+                "Repetition of 58% ITC could suggest limited diversity of strong points"
+            ],
+            "deep_insights": {
+                "numerical_psychology": [
+                    "58% carefully chosen - high enough for credibility, not so high as to suggest tokenism",
+                    "92% ITC coverage suggests exceptional existing networks or relationships",
+                    "Exactly 50% repeated across metrics suggests calculated compliance approach",
+                    "40% industry participation is ambitious but realistic - shows confidence without arrogance",
+                    "45% young researcher leadership balances empowerment with experience"
+                ],
+                "language_strategy": [
+                    "'Reserved' positions implies proactive planning rather than reactive compliance",
+                    "'Substantial' used repeatedly to emphasize scale and seriousness",
+                    "'Already' and 'currently' establish track record credibility",
+                    "'Throughout the lifetime' shows long-term commitment beyond startup phase",
+                    "Parenthetical clarifications show careful legal-style positioning"
+                ],
+                "positioning_tactics": [
+                    "Opens with strongest metric (58%) for immediate credibility establishment",
+                    "Places ultimate commitment (Grant Holder from ITC) in strategic middle position",
+                    "Uses specific COST terminology to demonstrate ecosystem understanding",
+                    "Combines compliance with aspiration ('50% or more') to show progressive stance",
+                    "Addresses multiple policy dimensions simultaneously for comprehensive coverage"
+                ],
+                "evidence_hierarchy": [
+                    "Specific numbers > general commitments > vague statements",
+                    "Current achievements > future promises > aspirational goals",
+                    "Concrete roles > general participation > symbolic involvement",
+                    "Financial commitments > positional commitments > participation commitments",
+                    "Measurable outcomes > process commitments > value statements"
+                ]
+            }
+        }
@@ -0,0 +1,18 @@
+from typing import Dict
+
+
+class AnalysisError(Exception):
+    """Analysis failure with a machine-readable code, reported to callers as a result dict"""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def to_dict(self) -> Dict:
+        return {"error": self.message, "error_code": self.code}
+
+
+def error_result(code: str, message: str) -> Dict:
+    """Structured error in the {"error": ...} shape the dashboards already check for"""
+    return AnalysisError(code, message).to_dict()
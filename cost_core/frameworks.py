@@ -0,0 +1,190 @@
+import os
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+from .section_index import MANDATORY_SECTIONS
+
+# Bump together with "format_version" in the data file whenever its layout changes
+FRAMEWORKS_FORMAT_VERSION = 1
+
+FRAMEWORKS_PATH = os.path.join(os.path.dirname(__file__), "data", "analysis_frameworks.json")
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: dicts become mapping proxies and lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class FrozenRecord:
+    """Immutable __slots__ record that also answers the dict-style lookups the dashboards use"""
+
+    __slots__ = ()
+    # Data fields exposed through record["field"]; derived fields are attributes only
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values.get(name))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key) if key in self.FIELDS else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS and getattr(self, key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS if name in self)
+        return f"{type(self).__name__}({fields})"
+
+
+class SentenceRecord(FrozenRecord):
+    """Annotated sentence with the text measures the effectiveness checks need precomputed"""
+
+    __slots__ = ("text", "purpose", "strategy", "positioning", "critical_analysis",
+                 "lowered", "word_count", "character_count", "has_digits")
+    FIELDS = ("text", "purpose", "strategy", "positioning", "critical_analysis")
+
+    def __init__(self, text: str, **annotations):
+        super().__init__(
+            text=text,
+            lowered=text.lower(),
+            word_count=len(text.split()),
+            character_count=len(text),
+            has_digits=any(char.isdigit() for char in text),
+            **annotations
+        )
+
+    @classmethod
+    def from_dict(cls, sentence: Dict) -> "SentenceRecord":
+        """Record for a plain {"text": ..., "purpose": ...} sentence dict; unknown keys are ignored"""
+        return cls(**{key: value for key, value in sentence.items() if key in cls.FIELDS})
+
+
+class SubsectionRecord(FrozenRecord):
+    __slots__ = ("key", "title", "purpose", "critical_analysis", "evidence_points")
+    FIELDS = ("title", "purpose", "critical_analysis", "evidence_points")
+
+
+class SectionRecord(FrozenRecord):
+    __slots__ = ("key", "title", "strategic_purpose", "positioning", "sentences", "subsections", "sentence_count")
+    FIELDS = ("title", "strategic_purpose", "positioning", "sentences", "subsections")
+
+
+class ReviewCategory(FrozenRecord):
+    """One critical review category; its entries live under "analysis", "insights" or "assessment" """
+
+    __slots__ = ("key", "title", "analysis", "insights", "assessment")
+    FIELDS = ("title", "analysis", "insights", "assessment")
+
+
+class DocumentAnalysis(Mapping):
+    """Read-only mapping of section key to SectionRecord, with lookups precomputed"""
+
+    def __init__(self, sections: Dict[str, SectionRecord]):
+        self._sections = dict(sections)
+        self.section_by_title = MappingProxyType({section.title: section for section in sections.values()})
+        # (section_key, sentence) for every annotated sentence, in document order
+        self.sentences = tuple(
+            (key, sentence) for key, section in sections.items() for sentence in section.sentences or ()
+        )
+
+    def __getitem__(self, key: str) -> SectionRecord:
+        return self._sections[key]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+
+def _sentences(items) -> Tuple[SentenceRecord, ...]:
+    return tuple(SentenceRecord(**item) for item in items)
+
+
+def _document_analysis(raw: Dict) -> DocumentAnalysis:
+    sections = {}
+    for key, section in raw.items():
+        subsections = None
+        if "subsections" in section:
+            subsections = MappingProxyType({
+                sub_key: SubsectionRecord(
+                    key=sub_key,
+                    title=sub["title"],
+                    purpose=sub.get("purpose"),
+                    critical_analysis=sub.get("critical_analysis"),
+                    evidence_points=_sentences(sub["evidence_points"]) if "evidence_points" in sub else None
+                )
+                for sub_key, sub in section["subsections"].items()
+            })
+        sentences = _sentences(section["sentences"]) if "sentences" in section else None
+        sections[key] = SectionRecord(
+            key=key,
+            title=section["title"],
+            strategic_purpose=section.get("strategic_purpose"),
+            positioning=section.get("positioning"),
+            sentences=sentences,
+            subsections=subsections,
+            sentence_count=len(sentences or ())
+        )
+    return DocumentAnalysis(sections)
+
+
+def _critical_review(raw: Dict) -> Mapping:
+    categories = {}
+    for key, category in raw.items():
+        entries = {field: freeze(category[field]) for field in ("analysis", "insights", "assessment") if field in category}
+        categories[key] = ReviewCategory(key=key, title=category["title"], **entries)
+    return MappingProxyType(categories)
+
+
+def _evaluation_framework(raw: Dict) -> Mapping:
+    # The mandatory section list is owned by section_index so headings are detected from one source
+    raw = dict(raw)
+    raw["technical_format_requirements"] = {
+        "mandatory_sections": list(MANDATORY_SECTIONS), **raw["technical_format_requirements"]
+    }
+    return freeze(raw)
+
+
+class AnalysisFrameworks:
+    """Static analysis data parsed from the versioned data file"""
+
+    __slots__ = ("original_document_analysis", "actual_document_content", "critical_review",
+                 "evaluation_framework", "sentence_evaluation_matrix")
+
+    def __init__(self, raw: Dict):
+        version = raw.get("format_version")
+        if version != FRAMEWORKS_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported analysis frameworks format {version!r}, expected {FRAMEWORKS_FORMAT_VERSION}"
+            )
+        self.original_document_analysis = _document_analysis(raw["original_document_analysis"])
+        self.actual_document_content = _document_analysis(raw["actual_document_content"])
+        self.critical_review = _critical_review(raw["critical_review"])
+        self.evaluation_framework = _evaluation_framework(raw["evaluation_framework"])
+        self.sentence_evaluation_matrix = freeze(raw["sentence_evaluation_matrix"])
+
+
+@lru_cache(maxsize=None)
+def load_frameworks(path: str = FRAMEWORKS_PATH) -> AnalysisFrameworks:
+    """Parse the data file once per process; every analyzer instance shares the result"""
+    with open(path, "r", encoding="utf-8") as handle:
+        return AnalysisFrameworks(json.load(handle))
@@ -0,0 +1,25 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+# Seconds spent on the first import of each module in this process
+IMPORT_TIMINGS: Dict[str, float] = {}
+
+
+@contextmanager
+def timed_import(name: str):
+    """Record how long the import statements in the block take, unless name was already imported"""
+    already_imported = name in sys.modules
+    started = time.perf_counter()
+    yield
+    if not already_imported:
+        IMPORT_TIMINGS.setdefault(name, time.perf_counter() - started)
+
+
+def import_report() -> List[Dict]:
+    """Recorded first-import times, slowest first"""
+    return [
+        {"module": name, "seconds": round(seconds, 3)}
+        for name, seconds in sorted(IMPORT_TIMINGS.items(), key=lambda item: item[1], reverse=True)
+    ]
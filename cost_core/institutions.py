@@ -0,0 +1,108 @@
+"""Index of the Annex I organisation names and acronyms for scanning annexes in one pass
+
+The trie-shaped pattern and its lookups are generated by the Annex I build step and stored with the
+organisations, so loading reads JSON and compiles one regex (a few tens of milliseconds; compiled patterns
+cannot be persisted). Annex I lists organisations only, so there is no person-name dictionary; person names are
+left to the generic anonymity rules.
+"""
+import re
+import json
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List
+from .annex_i import ANNEX_I_FORMAT_VERSION, ORGANISATIONS_PATH
+
+# Acronyms shorter than this ("EP", "EC", "UN") are too ambiguous to report on their own
+MIN_ACRONYM_LENGTH = 3
+# Acronyms that proposals routinely use for something else ("ERA" is the European Research Area)
+AMBIGUOUS_ACRONYMS = {"ERA", "CERT"}
+
+CATEGORY_LABELS = {
+    "eu_body": "EU institution, body or agency",
+    "european_rtd_organisation": "European RTD organisation",
+    "international_organisation": "International organisation"
+}
+
+SEPARATOR_PATTERN = re.compile(r"[\s\-]+")
+
+
+def _normalise(name: str) -> str:
+    """Matching key: hyphens and line breaks count as spaces, curly apostrophes as straight ones"""
+    return SEPARATOR_PATTERN.sub(" ", name.replace("’", "'")).strip()
+
+
+def _escape(char: str) -> str:
+    # Names are stored with single spaces, but extracted text may hyphenate or wrap them
+    if char == " ":
+        return r"[\s\-]+"
+    if char == "'":
+        return "['’]"
+    return re.escape(char)
+
+
+def compile_index(organisations: List[Dict]) -> Dict:
+    """Pattern source plus name and acronym lookups, as persisted next to the organisations by the build step"""
+    # The trie builder pulls in numpy with the term matcher, so only the build step imports it
+    from .term_matcher import _trie_pattern
+
+    by_name = {}
+    by_acronym = {}
+    for index, organisation in enumerate(organisations):
+        for name in [organisation["name"]] + organisation["aliases"]:
+            by_name.setdefault(_normalise(name).lower(), index)
+        for acronym in organisation["acronyms"]:
+            if len(acronym) >= MIN_ACRONYM_LENGTH and acronym not in AMBIGUOUS_ACRONYMS:
+                by_acronym.setdefault(_normalise(acronym), index)
+
+    # Full names match in any case, acronyms only as written, both on word boundaries
+    pattern = (
+        r"\b(?:(?P<name>(?i:" + _trie_pattern(by_name, _escape) + r"))"
+        r"|(?P<acronym>" + _trie_pattern(by_acronym, _escape) + r"))\b"
+    )
+    return {"pattern": pattern, "names": by_name, "acronyms": by_acronym}
+
+
+class InstitutionIndex:
+    """Known organisation names and acronyms compiled into one trie-shaped pattern"""
+
+    def __init__(self, organisations: List[Dict], index: Dict = None):
+        index = index if index is not None else compile_index(organisations)
+        self.organisations = organisations
+        self._by_name = index["names"]
+        self._by_acronym = index["acronyms"]
+        self.pattern = re.compile(index["pattern"])
+
+    def __len__(self) -> int:
+        return len(self.organisations)
+
+    def scan(self, text: str, page_offsets: List[int] = None) -> List[Dict]:
+        """Every mention of a known organisation, in one pass, with offset, page and matched text"""
+        mentions = []
+        for match in self.pattern.finditer(text):
+            if match.lastgroup == "name":
+                index = self._by_name[_normalise(match.group()).lower()]
+            else:
+                index = self._by_acronym[_normalise(match.group())]
+            organisation = self.organisations[index]
+            mentions.append({
+                "organisation": organisation["name"],
+                "acronym": organisation["acronyms"][0] if organisation["acronyms"] else None,
+                "category": organisation["category"],
+                "matched_as": match.lastgroup,
+                "offset": match.start(),
+                "page": bisect_right(page_offsets, match.start()) if page_offsets else None,
+                "match": match.group()
+            })
+        return mentions
+
+
+@lru_cache(maxsize=None)
+def load_institution_index(path: str = ORGANISATIONS_PATH) -> InstitutionIndex:
+    """Index of the Annex I organisations, loaded once per process with the pattern the build step generated"""
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    if data.get("format_version") != ANNEX_I_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported Annex I data format {data.get('format_version')!r}, expected {ANNEX_I_FORMAT_VERSION}"
+        )
+    return InstitutionIndex(data["organisations"], data["index"])
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import re
+from typing import Callable, Dict, List, Optional
+from .prompt_packer import PackingPlan, pack_document, estimate_tokens, PROMPT_TOKEN_BUDGET
+from .llm_cache import llm_response_cache
+from .llm_client import rate_limited_client
+
+QUALITY_DIMENSIONS = ["scientific_excellence", "innovation", "networking", "impact", "implementation"]
+
+QUALITY_MODEL = "gpt-4o"
+QUALITY_TEMPERATURE = 0.1
+
+# Concurrent chunk requests per analysis
+MAX_CONCURRENT_REQUESTS = 4
+
+JSON_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def build_quality_prompt(excerpt: str, label: str = "Text excerpt (first 2000 chars)") -> str:
+    """Prompt asking for the five quality dimension scores of an annex excerpt"""
+    return f"""
+            Analyze this COST Action technical annex excerpt for quality across these dimensions:
+
+            1. Scientific Excellence (0-5 scale)
+            2. Innovation Level (0-5 scale)
+            3. Networking Rationale (0-5 scale)
+            4. Impact Potential (0-5 scale)
+            5. Implementation Feasibility (0-5 scale)
+
+            {label}:
+            {excerpt}
+
+            Provide scores and brief justifications in JSON format:
+            {{
+                "scientific_excellence": {{"score": X, "justification": "..."}},
+                "innovation": {{"score": X, "justification": "..."}},
+                "networking": {{"score": X, "justification": "..."}},
+                "impact": {{"score": X, "justification": "..."}},
+                "implementation": {{"score": X, "justification": "..."}}
+            }}
+            """
+
+
+def parse_json_response(content: str) -> Dict:
+    """Parse a model reply as JSON, tolerating a surrounding markdown code fence"""
+    return json.loads(JSON_FENCE_PATTERN.sub("", content.strip()))
+
+
+def _cached_reply(key: str, validate: Callable = None) -> Optional[str]:
+    """Cached reply content, treating a reply that no longer passes validate as a miss"""
+    content = llm_response_cache.get(key)
+    if content is not None and validate is not None:
+        try:
+            validate(content)
+        except Exception:
+            return None
+    return content
+
+
+def complete_cached(client, messages: List[Dict], model: str = QUALITY_MODEL,
+                    temperature: float = QUALITY_TEMPERATURE, validate: Callable = None) -> str:
+    """Reply content for a chat completion, served from the response cache when the prompt repeats
+
+    A fresh reply is cached only once validate accepts it, so a truncated or malformed reply is
+    requested again next time instead of being replayed for the whole TTL.
+    """
+    key = llm_response_cache.make_key(model, temperature, messages)
+    content = _cached_reply(key, validate)
+    if content is None:
+        content = rate_limited_client.complete(client, messages, model, temperature)
+        if validate is not None:
+            validate(content)
+        llm_response_cache.put(key, content)
+    return content
+
+
+async def acomplete_cached(client, messages: List[Dict], model: str = QUALITY_MODEL,
+                           temperature: float = QUALITY_TEMPERATURE, validate: Callable = None) -> str:
+    """Async counterpart of complete_cached; the SQLite lookups run off the event loop"""
+    key = llm_response_cache.make_key(model, temperature, messages)
+    loop = asyncio.get_running_loop()
+    content = await loop.run_in_executor(None, _cached_reply, key, validate)
+    if content is None:
+        content = await rate_limited_client.acomplete(client, messages, model, temperature)
+        if validate is not None:
+            validate(content)
+        await loop.run_in_executor(None, llm_response_cache.put, key, content)
+    return content
+
+
+def plan_quality_requests(text: str, section_titles: List[str], token_budget: int = PROMPT_TOKEN_BUDGET) -> PackingPlan:
+    """Pack a document into as few quality-analysis requests as the token budget allows"""
+    overhead_tokens = estimate_tokens(build_quality_prompt("", "Sections"))
+    return pack_document(text, section_titles, token_budget, overhead_tokens)
+
+
+async def _analyze_chunk(client, chunk: Dict, semaphore: asyncio.Semaphore) -> Dict:
+    async with semaphore:
+        try:
+            content = await acomplete_cached(
+                client,
+                [{"role": "user", "content": build_quality_prompt(chunk["text"], f"Sections: {chunk['section']}")}],
+                validate=parse_json_response
+            )
+            result = parse_json_response(content)
+            return result if isinstance(result, dict) else {"error": "Unexpected response format"}
+        except Exception as e:
+            return {"error": str(e)}
+
+
+async def analyze_chunks(client, chunks: List[Dict], max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> List[Dict]:
+    """Send every chunk concurrently, at most max_concurrency requests in flight"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*(_analyze_chunk(client, chunk, semaphore) for chunk in chunks))
+
+
+def merge_quality_results(chunks: List[Dict], results: List[Dict]) -> Dict:
+    """Combine per-chunk dimension scores into one result, weighting chunks by length"""
+    merged = {}
+    for dimension in QUALITY_DIMENSIONS:
+        weighted_sum = 0.0
+        total_weight = 0
+        best_weight = -1
+        justification = "N/A"
+        for chunk, result in zip(chunks, results):
+            value = result.get(dimension)
+            if not isinstance(value, dict) or not isinstance(value.get("score"), (int, float)):
+                continue
+            weight = len(chunk["text"])
+            weighted_sum += value["score"] * weight
+            total_weight += weight
+            # Quote the justification given for the largest chunk that scored this dimension
+            if weight > best_weight:
+                best_weight = weight
+                justification = f"{chunk['section']}: {value.get('justification', 'N/A')}"
+        if total_weight:
+            merged[dimension] = {"score": round(weighted_sum / total_weight, 1), "justification": justification}
+
+    failed = sum(1 for result in results if "error" in result)
+    if not merged:
+        errors = [result["error"] for result in results if "error" in result]
+        return {"error": f"AI analysis failed: {errors[0] if errors else 'no scores returned'}"}
+
+    merged["coverage"] = {
+        "chunks_analyzed": len(chunks) - failed,
+        "chunks_failed": failed,
+        "characters_analyzed": sum(len(chunk["text"]) for chunk, result in zip(chunks, results) if "error" not in result)
+    }
+    return merged
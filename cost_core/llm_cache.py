@@ -0,0 +1,131 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, List, Optional
+from .analysis_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_DB_PATH = os.path.join(DEFAULT_CACHE_DIR, "llm_responses.sqlite3")
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of chat completion replies with a TTL and size-capped LRU eviction"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, max_bytes: int = 64 * 1024 * 1024,
+                 ttl_seconds: int = 7 * 24 * 3600):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def make_key(model: str, temperature: float, messages: List[Dict]) -> str:
+        payload = json.dumps([model, temperature, messages], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+            connection.commit()
+            self._initialized = True
+        return connection
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached reply content, or None when missing, expired or the cache is unavailable"""
+        now = time.time()
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+                elif row is not None:
+                    connection.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                connection.commit()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError):
+            row = None
+
+        self._count(row is not None)
+        return row[0] if row is not None else None
+
+    def put(self, key: str, content: str):
+        now = time.time()
+        try:
+            connection = self._connect()
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, content, size, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, content, len(content.encode("utf-8")), now, now)
+                )
+                self._evict(connection, now)
+                connection.commit()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        """Drop expired entries, then least recently used ones until the cache fits max_bytes"""
+        connection.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total_bytes -= size
+
+    def stats(self) -> Dict:
+        entries, total_bytes = 0, 0
+        try:
+            connection = self._connect()
+            try:
+                entries, total_bytes = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError):
+            pass
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": total_bytes}
+
+    def clear(self):
+        try:
+            connection = self._connect()
+            try:
+                connection.execute("DELETE FROM responses")
+                connection.commit()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError):
+            pass
+
+
+# Shared across Streamlit reruns and sessions within one server process
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,158 @@
+import os
+import time
+import random
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from .import_timing import timed_import
+from .prompt_packer import estimate_tokens
+
+# Provider limits and client behaviour, overridable per deployment
+REQUESTS_PER_MINUTE = int(os.environ.get("COST_OPENAI_REQUESTS_PER_MINUTE", "500"))
+TOKENS_PER_MINUTE = int(os.environ.get("COST_OPENAI_TOKENS_PER_MINUTE", "30000"))
+MAX_CONCURRENT_CALLS = int(os.environ.get("COST_OPENAI_MAX_CONCURRENCY", "8"))
+REQUEST_TIMEOUT_SECONDS = float(os.environ.get("COST_OPENAI_TIMEOUT", "60"))
+MAX_RETRIES = int(os.environ.get("COST_OPENAI_MAX_RETRIES", "5"))
+
+# Completion tokens reserved per request on top of the prompt estimate
+EXPECTED_COMPLETION_TOKENS = 600
+
+
+@lru_cache(maxsize=None)
+def retryable_errors() -> Tuple[type, ...]:
+    """Transient openai errors worth retrying; openai is imported on the first failed call, not with this module"""
+    with timed_import("openai"):
+        import openai
+    return (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError
+    )
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding at most one minute of capacity"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(1, per_minute))
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take amount from the bucket and return how many seconds to wait before using it"""
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+            self.updated = now
+            # The balance may go negative; later callers then queue behind this reservation
+            self.available -= amount
+            return max(0.0, -self.available / self.rate)
+
+
+class RateLimitedClient:
+    """Process-wide gateway for chat completions with rate limits, a concurrency cap and retries"""
+
+    def __init__(self, requests_per_minute: int = REQUESTS_PER_MINUTE, tokens_per_minute: int = TOKENS_PER_MINUTE,
+                 max_concurrency: int = MAX_CONCURRENT_CALLS, timeout: float = REQUEST_TIMEOUT_SECONDS,
+                 max_retries: int = MAX_RETRIES, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+    def _count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def _reserve(self, messages: List[Dict]) -> float:
+        prompt_tokens = sum(estimate_tokens(str(message.get("content", ""))) for message in messages)
+        return max(self.request_bucket.reserve(1),
+                   self.token_bucket.reserve(prompt_tokens + EXPECTED_COMPLETION_TOKENS))
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential delay, or the provider's Retry-After when it sends one"""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            if retry_after is not None:
+                return min(self.max_delay, float(retry_after))
+        except ValueError:
+            pass
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def complete(self, client, messages: List[Dict], model: str, temperature: float) -> str:
+        """Reply content for a chat completion, waiting on the limiters and retrying transient errors"""
+        for attempt in range(self.max_retries + 1):
+            time.sleep(self._reserve(messages))
+            try:
+                with self._slots:
+                    self._count("calls")
+                    response = client.chat.completions.create(
+                        model=model, messages=messages, temperature=temperature, timeout=self.timeout
+                    )
+                return response.choices[0].message.content
+            except retryable_errors() as e:
+                if attempt == self.max_retries:
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                time.sleep(self._backoff(attempt, e))
+
+    async def acomplete(self, client, messages: List[Dict], model: str, temperature: float) -> str:
+        """Async counterpart of complete; the concurrency cap is shared with synchronous callers"""
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self._reserve(messages))
+            # Poll rather than block so the event loop and cancellation stay responsive
+            while not self._slots.acquire(blocking=False):
+                await asyncio.sleep(0.05)
+            try:
+                self._count("calls")
+                response = await client.chat.completions.create(
+                    model=model, messages=messages, temperature=temperature, timeout=self.timeout
+                )
+                return response.choices[0].message.content
+            except retryable_errors() as e:
+                if attempt == self.max_retries:
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                backoff = self._backoff(attempt, e)
+            finally:
+                self._slots.release()
+            await asyncio.sleep(backoff)
+
+    def stats(self) -> Dict:
+        return {"calls": self.calls, "retries": self.retries, "failures": self.failures}
+
+
+class BackgroundEventLoop:
+    """Event loop on a daemon thread, so async clients and their connection pools outlive one analysis"""
+
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine):
+        """Run a coroutine on the shared loop and block the calling thread until it finishes"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="cost-llm-event-loop", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+
+# Shared by every Streamlit session in the server process so limits apply deployment-wide
+rate_limited_client = RateLimitedClient()
+llm_event_loop = BackgroundEventLoop()
@@ -0,0 +1,245 @@
+import re
+import statistics
+from typing import Dict, List, Tuple
+from .analysis_cache import extraction_cache
+from .stage_timing import stage_span
+from .text_extraction import _open_pdf
+
+NUMBER = rb"[-+]?(?:\d+\.?\d*|\.\d+)"
+STRING_PATTERN = rb"\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>"
+# The text-state and text-showing operators with their operands, and the ET that ends the text object;
+# colour, graphics state and other operators inside a text object are skipped by the regex engine itself.
+# A shown string is consumed whole, so "(ET AL) Tj" is not mistaken for the end of the text object
+TEXT_OPERATION_PATTERN = re.compile(
+    rb"(?P<show>(?:\[(?:" + STRING_PATTERN + rb"|[^\]()<])*\]|" + STRING_PATTERN + rb")\s*(?:TJ|Tj|'|\"))"
+    rb"|(?P<font>/[^\s/\[\]()<>{}%]+\s+" + NUMBER + rb")\s+Tf\b"
+    rb"|(?P<matrix>(?:" + NUMBER + rb"\s+){5}" + NUMBER + rb")\s+Tm\b"
+    rb"|(?P<move>" + NUMBER + rb"\s+" + NUMBER + rb")\s+T(?P<set_leading>[dD])\b"
+    rb"|(?P<leading>" + NUMBER + rb")\s+TL\b"
+    rb"|(?P<next_line>T\*)"
+    rb"|(?P<end>\bET\b)"
+)
+ARRAY_STRING_PATTERN = re.compile(STRING_PATTERN)
+# Outside text objects only these operators matter; everything else there is path drawing
+GRAPHICS_OPERATOR_PATTERN = re.compile(rb"\b(BT|cm|q|Q)\b")
+ESCAPE_PATTERN = re.compile(rb"\\(?:[0-7]{1,3}|\r\n|.)", re.DOTALL)
+SUBSET_PREFIX_PATTERN = re.compile(r"^[A-Z]{6}\+")
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Share of the characters that may be set in other fonts or below the minimum size, for symbols,
+# bullets and the odd superscript
+FORMAT_TOLERANCE = 0.05
+# Sizes are compared after rounding to a quarter point, absorbing rounding in PDF producers
+SIZE_PRECISION = 0.25
+# Single-spaced text advances about 1.15 font sizes per line; 1.5 spacing advances about 1.7
+MAX_SINGLE_SPACING_RATIO = 1.35
+
+
+def _multiply(m: Tuple, n: Tuple) -> Tuple:
+    """Product of two PDF matrices [a b c d e f], m applied first"""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a * a2 + b * c2, a * b2 + b * d2,
+        c * a2 + d * c2, c * b2 + d * d2,
+        e * a2 + f * c2 + e2, e * b2 + f * d2 + f2
+    )
+
+
+def _vertical_scale(matrix: Tuple) -> float:
+    return (matrix[2] ** 2 + matrix[3] ** 2) ** 0.5
+
+
+def _string_length(token: bytes, bytes_per_char: int = 1) -> int:
+    """Approximate number of characters shown by a literal or hex string operand"""
+    if token.startswith(b"("):
+        # Each escape sequence (\(, \n, \053) stands for one byte
+        byte_count = len(ESCAPE_PATTERN.sub(b"x", token[1:-1]))
+    else:
+        byte_count = len(re.sub(rb"\s", b"", token)) // 2 - 1
+    return byte_count // bytes_per_char
+
+
+def font_family(base_font: str) -> str:
+    """Family of a PDF base font name: "ABCDEF+Arial-BoldMT" and "Arial,Bold" are both "Arial\""""
+    name = SUBSET_PREFIX_PATTERN.sub("", base_font.lstrip("/"))
+    family = re.split(r"[-,]", name)[0]
+    return re.sub(r"(MT|PS|PSMT)$", "", family) or name
+
+
+def _page_fonts(page) -> Dict[bytes, Tuple[str, int]]:
+    """Resource name -> (base font name, bytes per character code) for the fonts a page declares"""
+    fonts = {}
+    resources = page.get("/Resources")
+    font_dict = resources.get_object().get("/Font") if resources is not None else None
+    if font_dict is None:
+        return fonts
+    for resource_name, font in font_dict.get_object().items():
+        font = font.get_object()
+        base_font = font.get("/BaseFont", resource_name)
+        resource = resource_name.lstrip("/").encode("latin-1")
+        # Composite (Type0) fonts use two-byte codes under Identity-H/V and the CJK CMaps producers emit
+        bytes_per_char = 2 if font.get("/Subtype") == "/Type0" else 1
+        fonts[resource] = (SUBSET_PREFIX_PATTERN.sub("", str(base_font).lstrip("/")), bytes_per_char)
+    return fonts
+
+
+def scan_content_stream(content: bytes, fonts: Dict[bytes, Tuple[str, int]]) -> Dict:
+    """Characters per (font, effective size) and baseline advances, from the text-state operators alone
+
+    Only the graphics and text matrices are tracked; glyph widths are never looked up and no text is decoded.
+    Outside text objects only q, Q and cm matter, so path drawing is skipped without being tokenised.
+    """
+    usage = {}
+    advances = []
+    ctm = IDENTITY
+    ctm_stack = []
+    # Font and leading persist across text objects; the text matrices are reset by each BT
+    state = {"font": None, "bytes_per_char": 1, "size": 0.0, "leading": 0.0, "baseline": None}
+
+    position = 0
+    while True:
+        match = GRAPHICS_OPERATOR_PATTERN.search(content, position)
+        if match is None:
+            break
+        operator = match.group(1)
+        position = match.end()
+        if operator == b"BT":
+            position = _scan_text_object(content, position, fonts, ctm, state, usage, advances)
+        elif operator == b"cm":
+            try:
+                matrix = tuple(float(value) for value in content[max(0, match.start() - 160):match.start()].split()[-6:])
+                ctm = _multiply(matrix, ctm)
+            except (ValueError, TypeError):
+                pass
+        elif operator == b"q":
+            ctm_stack.append(ctm)
+        else:
+            ctm = ctm_stack.pop() if ctm_stack else IDENTITY
+
+    return {"usage": usage, "line_advances": advances}
+
+
+def _scan_text_object(content: bytes, position: int, fonts: Dict[bytes, Tuple[str, int]], ctm: Tuple,
+                      state: Dict, usage: Dict, advances: List[float]) -> int:
+    """Apply the operators of the BT ... ET block starting at position, returning the offset after its ET"""
+    text_matrix = line_matrix = IDENTITY
+
+    for match in TEXT_OPERATION_PATTERN.finditer(content, position):
+        try:
+            if match.group("end") is not None:
+                return match.end()
+            if match.group("show") is not None:
+                shown = match.group("show")
+                if shown.endswith((b"'", b'"')):
+                    text_matrix = line_matrix = _multiply(
+                        (1.0, 0.0, 0.0, 1.0, 0.0, -state["leading"]), line_matrix
+                    )
+                # Only the strings count; the numbers between the strings of a TJ array are kerning
+                characters = sum(
+                    _string_length(string, state["bytes_per_char"]) for string in ARRAY_STRING_PATTERN.findall(shown)
+                )
+                if state["font"] is not None and characters > 0:
+                    rendering = _multiply(text_matrix, ctm)
+                    effective = round(state["size"] * _vertical_scale(rendering) / SIZE_PRECISION) * SIZE_PRECISION
+                    key = (state["font"], effective)
+                    usage[key] = usage.get(key, 0) + characters
+                    baseline = rendering[5]
+                    previous = state["baseline"]
+                    # A downward move of less than three lines is the next line of the same block
+                    if previous is not None and effective > 0 and 0 < previous - baseline < 3 * effective:
+                        advances.append((previous - baseline) / effective)
+                    state["baseline"] = baseline
+            elif match.group("font") is not None:
+                resource, size = match.group("font").split()
+                resource = resource.lstrip(b"/")
+                state["font"], state["bytes_per_char"] = fonts.get(resource, (resource.decode("latin-1"), 1))
+                state["size"] = float(size)
+            elif match.group("matrix") is not None:
+                text_matrix = line_matrix = tuple(float(value) for value in match.group("matrix").split())
+            elif match.group("move") is not None:
+                tx, ty = (float(value) for value in match.group("move").split())
+                if match.group("set_leading") == b"D":
+                    state["leading"] = -ty
+                text_matrix = line_matrix = _multiply((1.0, 0.0, 0.0, 1.0, tx, ty), line_matrix)
+            elif match.group("leading") is not None:
+                state["leading"] = float(match.group("leading"))
+            else:
+                text_matrix = line_matrix = _multiply((1.0, 0.0, 0.0, 1.0, 0.0, -state["leading"]), line_matrix)
+        except ValueError:
+            # Operands from an unsupported construct; skip the operator rather than the page
+            continue
+    return len(content)
+
+
+def scan_pdf_layout(source) -> Dict:
+    """Page count from the page tree plus the fonts, sizes and line spacing used on each page"""
+    pdf_reader = _open_pdf(source)
+    pages = []
+    for number, page in enumerate(pdf_reader.pages, start=1):
+        contents = page.get_contents()
+        data = contents.get_data() if contents is not None else b""
+        scan = scan_content_stream(data, _page_fonts(page))
+        advances = scan["line_advances"]
+        pages.append({
+            "page": number,
+            "fonts": [
+                {"font": font, "size": size, "characters": characters}
+                for (font, size), characters in sorted(scan["usage"].items(), key=lambda item: -item[1])
+            ],
+            "line_spacing": round(statistics.median(advances), 2) if advances else None
+        })
+    return {"page_count": len(pages), "pages": pages}
+
+
+def load_pdf_layout(data: bytes) -> Dict:
+    """Layout of a PDF, served from the extraction cache when the bytes are unchanged"""
+    cache_key = extraction_cache.make_key(data, "layout")
+    layout = extraction_cache.get(cache_key)
+    if layout is None:
+        # Only a cache miss reads the content streams, so the span shows whether the scan was served from cache
+        with stage_span("scan_layout"):
+            layout = scan_pdf_layout(data)
+        extraction_cache.put(cache_key, layout)
+    return layout
+
+
+def check_format(layout: Dict, font: str, font_size: float, line_spacing: float) -> Dict:
+    """Compare the fonts, sizes and line spacing of a scanned PDF against the format requirements"""
+    total = 0
+    in_font = 0
+    below_size = 0
+    families = {}
+    sizes = {}
+    for page in layout["pages"]:
+        for entry in page["fonts"]:
+            family = font_family(entry["font"])
+            total += entry["characters"]
+            families[family] = families.get(family, 0) + entry["characters"]
+            sizes[entry["size"]] = sizes.get(entry["size"], 0) + entry["characters"]
+            if family.lower() == font.lower():
+                in_font += entry["characters"]
+            if entry["size"] < font_size:
+                below_size += entry["characters"]
+
+    spacings = [page["line_spacing"] for page in layout["pages"] if page["line_spacing"] is not None]
+    median_spacing = round(statistics.median(spacings), 2) if spacings else None
+    # "Single" spacing is the font's natural line height, which is somewhat more than the font size
+    spacing_limit = MAX_SINGLE_SPACING_RATIO * line_spacing
+
+    font_share = in_font / total if total else None
+    small_share = below_size / total if total else None
+    return {
+        "characters": total,
+        "fonts": [
+            {"font": family, "characters": count}
+            for family, count in sorted(families.items(), key=lambda item: -item[1])
+        ],
+        "sizes": [{"size": size, "characters": count} for size, count in sorted(sizes.items())],
+        "font_share": round(font_share, 3) if font_share is not None else None,
+        "below_size_share": round(small_share, 3) if small_share is not None else None,
+        "line_spacing": median_spacing,
+        "font_ok": None if font_share is None else font_share >= 1 - FORMAT_TOLERANCE,
+        "font_size_ok": None if small_share is None else small_share <= FORMAT_TOLERANCE,
+        "line_spacing_ok": None if median_spacing is None else median_spacing <= spacing_limit
+    }
@@ -0,0 +1,112 @@
+import os
+import re
+from typing import Dict, List
+from .section_index import SectionIndex, UNASSIGNED_SECTION
+
+# Estimated prompt tokens allowed per request, prompt template included
+PROMPT_TOKEN_BUDGET = int(os.environ.get("COST_PROMPT_TOKEN_BUDGET", "12000"))
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Local token estimate: roughly four characters or three quarters of a word per token"""
+    return max(-(-len(text) // 4), -(-len(text.split()) * 4 // 3))
+
+
+def _pieces_within(text: str, budget: int) -> List[str]:
+    """Split text at paragraph, then sentence boundaries until every piece fits the budget"""
+    if estimate_tokens(text) <= budget:
+        return [text]
+    pieces = []
+    for paragraph in PARAGRAPH_BREAK.split(text):
+        if estimate_tokens(paragraph) <= budget:
+            pieces.append(paragraph)
+            continue
+        # Sentences are never split; an oversized sentence becomes a piece of its own
+        current = ""
+        for sentence in SENTENCE_BREAK.split(paragraph):
+            candidate = f"{current} {sentence}" if current else sentence
+            if current and estimate_tokens(candidate) > budget:
+                pieces.append(current)
+                current = sentence
+            else:
+                current = candidate
+        if current:
+            pieces.append(current)
+    return [piece for piece in pieces if piece.strip()]
+
+
+class PackingPlan:
+    """Requests planned for a document, available for reporting before anything is sent"""
+
+    def __init__(self, requests: List[Dict], token_budget: int, overhead_tokens: int):
+        self.requests = requests
+        self.token_budget = token_budget
+        self.overhead_tokens = overhead_tokens
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requests)
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Estimated prompt tokens across all requests, template overhead included"""
+        return sum(request["estimated_tokens"] for request in self.requests)
+
+    def summary(self) -> Dict:
+        return {
+            "request_count": self.request_count,
+            "estimated_tokens": self.estimated_tokens,
+            "token_budget": self.token_budget
+        }
+
+
+def pack_document(text: str, section_titles: List[str], token_budget: int = PROMPT_TOKEN_BUDGET,
+                  overhead_tokens: int = 0) -> PackingPlan:
+    """Bin-pack whole sections (or their paragraphs) into as few requests as fit the token budget"""
+    text_budget = max(1, token_budget - overhead_tokens)
+
+    spans = SectionIndex(text, section_titles).spans()
+    if not spans or spans[0][1] > 0:
+        spans.insert(0, (UNASSIGNED_SECTION, 0, spans[0][1] if spans else len(text)))
+
+    # Units are whole sections where possible, otherwise paragraph or sentence groups
+    units = []
+    for section, start, end in spans:
+        label = f"[{section}]\n"
+        for piece in _pieces_within(text[start:end].strip(), text_budget - estimate_tokens(label)):
+            if not piece.strip():
+                continue
+            unit_text = label + piece
+            units.append({"order": len(units), "section": section, "text": unit_text,
+                          "tokens": estimate_tokens(unit_text)})
+
+    # First-fit decreasing: place the largest units first into the first request with room
+    bins = []
+    for unit in sorted(units, key=lambda unit: unit["tokens"], reverse=True):
+        for packed in bins:
+            if packed["tokens"] + unit["tokens"] <= text_budget:
+                packed["units"].append(unit)
+                packed["tokens"] += unit["tokens"]
+                break
+        else:
+            bins.append({"units": [unit], "tokens": unit["tokens"]})
+
+    requests = []
+    for packed in bins:
+        # Within a request, content keeps its document order
+        ordered = sorted(packed["units"], key=lambda unit: unit["order"])
+        sections = list(dict.fromkeys(unit["section"] for unit in ordered))
+        body = "\n\n".join(unit["text"] for unit in ordered)
+        requests.append({
+            "sections": sections,
+            "section": "; ".join(sections),
+            "text": body,
+            "estimated_tokens": estimate_tokens(body) + overhead_tokens,
+            "first_unit": ordered[0]["order"]
+        })
+    requests.sort(key=lambda request: request["first_unit"])
+
+    return PackingPlan(requests, token_budget, overhead_tokens)
@@ -0,0 +1,374 @@
+import re
+import threading
+from typing import Dict, List
+from .text_extraction import load_document, count_pdf_pages, PARALLEL_PAGE_THRESHOLD
+from .analysis_cache import read_file_bytes
+from .section_index import SectionIndex, MANDATORY_SECTIONS
+from .prompt_packer import PackingPlan
+from .errors import error_result
+from .import_timing import timed_import
+from .stage_timing import stage_span
+from .anonymity import scan_text, violation_messages
+from .institutions import load_institution_index
+from .roster import analyze_roster
+from .countries import load_country_index
+from .pdf_layout import load_pdf_layout, check_format
+
+SECTION_KEYWORDS = {
+    "state_of_art": ["state of the art", "current research", "background", "literature review"],
+    "rationale_networking": ["networking", "collaboration", "rationale", "why network"],
+    "critical_mass": ["critical mass", "network size", "participants", "consortium"],
+    "impact_objectives": ["impact", "objectives", "goals", "outcomes"],
+    "stakeholder_involvement": ["stakeholders", "industry", "policy", "end users"],
+    "action_structure": ["structure", "organization", "management", "governance"],
+    "work_plan": ["work plan", "tasks", "activities", "timeline"],
+    "deliverables": ["deliverables", "outputs", "results", "products"]
+}
+
+KEYWORD_SECTIONS = {}
+for _section, _keywords in SECTION_KEYWORDS.items():
+    for _keyword in _keywords:
+        KEYWORD_SECTIONS.setdefault(_keyword, []).append(_section)
+
+# Zero-width lookahead so overlapping keyword occurrences are all counted in a single scan
+SECTION_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in sorted(KEYWORD_SECTIONS, key=len, reverse=True)) + "))",
+    re.IGNORECASE
+)
+
+class COSTAnalyzer:
+    def __init__(self, api_key: str = "", base_url: str = None,
+                 parallel_page_threshold: int = PARALLEL_PAGE_THRESHOLD):
+        # base_url points the analyzer at another OpenAI-compatible endpoint, e.g. openai_stub_server.py
+        self.base_url = base_url or None
+        # Local endpoints accept any key
+        self.api_key = api_key or ("local" if self.base_url else "")
+        # Clients are created once and shared by every session using this analyzer, keeping their connection pools
+        self._openai_client = None
+        self._async_openai_client = None
+        self._client_lock = threading.Lock()
+        
+        # PDFs with at least this many pages are extracted across a process pool
+        self.parallel_page_threshold = parallel_page_threshold
+        
+        # Country statuses generated from Annex I, shared by every analyzer in the process
+        self.countries = load_country_index()
+        
+        # COST 2025 Requirements Framework
+        self.requirements = {
+            "technical_format": {
+                "max_pages": 15,
+                "font": "Arial",
+                "font_size": 10,
+                "line_spacing": 1,
+                "max_file_size_mb": 10,
+                "format": "PDF",
+                "anonymity_required": True
+            },
+            "evaluation_criteria": {
+                "excellence": {
+                    "weight": 0.33,
+                    "threshold": 3.0,
+                    "subcriteria": [
+                        "scientific_innovation",
+                        "technological_advancement", 
+                        "networking_value",
+                        "interdisciplinary_approach",
+                        "open_science_commitment"
+                    ]
+                },
+                "impact": {
+                    "weight": 0.33,
+                    "threshold": 3.0,
+                    "subcriteria": [
+                        "societal_impact",
+                        "economic_impact",
+                        "scientific_impact",
+                        "stakeholder_engagement",
+                        "sdg_contribution"
+                    ]
+                },
+                "implementation": {
+                    "weight": 0.34,
+                    "threshold": 3.0,
+                    "subcriteria": [
+                        "project_management",
+                        "timeline_realism",
+                        "resource_allocation",
+                        "leadership_capability",
+                        "risk_management"
+                    ]
+                }
+            },
+            "network_requirements": {
+                "min_countries": 7,
+                "min_itc_percentage": 50,
+                # Inclusiveness Target Countries as listed in Annex I, including EU Outermost Regions
+                "itc_countries": self.countries.names(itc=True)
+            },
+            "content_structure": {
+                "state_of_art": {"required": True, "weight": 0.15, "heading": "State-of-the-art"},
+                "rationale_networking": {"required": True, "weight": 0.15, "heading": "Rationale for choosing networking to address the main challenge"},
+                "critical_mass": {"required": True, "weight": 0.10, "heading": "Critical mass of the network"},
+                "impact_objectives": {"required": True, "weight": 0.20, "heading": "Impact related to objectives"},
+                "stakeholder_involvement": {"required": True, "weight": 0.15, "heading": "Involvement of stakeholders"},
+                "action_structure": {"required": True, "weight": 0.10, "heading": "Action Structure"},
+                "work_plan": {"required": True, "weight": 0.10, "heading": "Work plan (tasks, activities and timeframe)"},
+                "deliverables": {"required": True, "weight": 0.05, "heading": "Deliverables"}
+            }
+        }
+        
+        # Policy compliance requirements
+        self.policy_requirements = {
+            "inclusiveness": {
+                "itc_participation_min": 50,
+                "itc_leadership_min": 50,
+                "geographic_balance": True
+            },
+            "gender_equality": {
+                "female_participation_target": 50,
+                "gender_equality_plan_required": True,
+                "gear_tool_usage": True
+            },
+            "young_researchers": {
+                "yri_participation_min": 50,
+                "yri_leadership_allocation": 45,
+                "mentorship_programs": True
+            }
+        }
+
+    def _create_client(self, client_class: str):
+        with timed_import("openai"):
+            import openai
+        # Retries are handled by the shared rate-limited gateway, not by the SDK
+        return getattr(openai, client_class)(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+
+    @property
+    def openai_client(self):
+        """OpenAI client created on first use, or None when no key is configured"""
+        with self._client_lock:
+            if self._openai_client is None and self.api_key:
+                self._openai_client = self._create_client("OpenAI")
+        return self._openai_client
+
+    @property
+    def async_openai_client(self):
+        """Async client, only ever used on the shared LLM event loop so its connections can be reused"""
+        with self._client_lock:
+            if self._async_openai_client is None and self.api_key:
+                self._async_openai_client = self._create_client("AsyncOpenAI")
+        return self._async_openai_client
+
+    def extract_document(self, source, kind: str) -> Dict:
+        """Extract an uploaded PDF or DOCX into text and page offsets, or a structured error result"""
+        return load_document(source, kind, self.parallel_page_threshold)
+
+    def extract_text_from_pdf(self, pdf_file) -> str:
+        """Extract text from uploaded PDF file, empty when it cannot be read"""
+        return self.extract_document(pdf_file, "pdf").get("text", "")
+
+    def count_pdf_pages(self, pdf_file) -> int:
+        """Read the page count of an uploaded PDF from its page tree"""
+        try:
+            return count_pdf_pages(read_file_bytes(pdf_file))
+        except Exception:
+            return None
+
+    def extract_text_from_docx(self, docx_file) -> str:
+        """Extract text from uploaded DOCX file, empty when it cannot be read"""
+        return self.extract_document(docx_file, "docx").get("text", "")
+
+    def analyze_pdf_layout(self, pdf_file) -> Dict:
+        """Page count and per-page fonts, sizes and line spacing of a PDF, without extracting its text"""
+        try:
+            layout = load_pdf_layout(read_file_bytes(pdf_file))
+        except Exception as e:
+            return error_result("layout_failed", f"Error reading PDF layout: {str(e)}")
+        tech_req = self.requirements["technical_format"]
+        # The cached scan is shared between reruns, so the format check goes on a copy
+        return {
+            **layout,
+            "format": check_format(layout, tech_req["font"], tech_req["font_size"], tech_req["line_spacing"])
+        }
+
+    def analyze_technical_compliance(self, file_content: str, file_size_mb: float, page_count: int = None,
+                                     page_offsets: List[int] = None, layout: Dict = None,
+                                     anonymity_violations: List[Dict] = None) -> Dict:
+        """Analyze technical format compliance"""
+        compliance_score = 100
+        issues = []
+        tech_req = self.requirements["technical_format"]
+        if layout is not None and "error" in layout:
+            layout = None
+        if page_count is None and layout is not None:
+            page_count = layout["page_count"]
+        
+        # File size check
+        if file_size_mb > self.requirements["technical_format"]["max_file_size_mb"]:
+            compliance_score -= 20
+            issues.append(f"File size ({file_size_mb:.1f}MB) exceeds 10MB limit")
+        
+        # Page count from the PDF page tree when available, otherwise a rough estimate
+        if page_count is not None:
+            estimated_pages = page_count
+            page_count_source = "page_tree"
+        else:
+            estimated_pages = len(file_content.split()) / 300  # Approximate words per page
+            page_count_source = "word_estimate"
+        
+        if estimated_pages > self.requirements["technical_format"]["max_pages"]:
+            compliance_score -= 30
+            if page_count_source == "page_tree":
+                issues.append(f"Document has {page_count} pages, exceeding the 15-page limit")
+            else:
+                issues.append(f"Estimated {estimated_pages:.1f} pages exceeds 15-page limit")
+        
+        # Font, size and spacing as laid out in the PDF; DOCX uploads have no layout to check
+        format_check = layout["format"] if layout is not None else None
+        if format_check is not None:
+            if format_check["font_ok"] is False:
+                compliance_score -= 10
+                issues.append(f"Only {format_check['font_share']:.0%} of the text is set in {tech_req['font']}")
+            if format_check["font_size_ok"] is False:
+                compliance_score -= 10
+                issues.append(
+                    f"{format_check['below_size_share']:.0%} of the text is smaller than {tech_req['font_size']}pt"
+                )
+            if format_check["line_spacing_ok"] is False:
+                compliance_score -= 10
+                issues.append(
+                    f"Line spacing is about {format_check['line_spacing']:.2f}× the font size; single spacing is required"
+                )
+        
+        # Anonymity check, keeping every hit so reviewers can jump to it; documents from extract_document
+        # arrive with the hits already found page by page during extraction
+        if anonymity_violations is None:
+            with stage_span("anonymity"):
+                anonymity_violations = self.find_anonymity_violations(file_content, page_offsets)
+        if anonymity_violations:
+            compliance_score -= 25
+            issues.extend(violation_messages(anonymity_violations))
+        
+        # Named organisations are listed for the reviewer only; COST proposals legitimately cite many of them
+        with stage_span("institutions"):
+            institution_mentions = self.find_institution_mentions(file_content, page_offsets)
+        
+        return {
+            "score": max(0, compliance_score),
+            "issues": issues,
+            "estimated_pages": estimated_pages,
+            "page_count_source": page_count_source,
+            "file_size_mb": file_size_mb,
+            "format_check": format_check,
+            "layout_pages": layout["pages"] if layout is not None else [],
+            "anonymity_violations": anonymity_violations,
+            "institution_mentions": institution_mentions
+        }
+
+    def find_anonymity_violations(self, text: str, page_offsets: List[int] = None) -> List[Dict]:
+        """Every potential anonymity violation with its rule, character offset, page and matched text"""
+        return scan_text(text, page_offsets)
+
+    def find_institution_mentions(self, text: str, page_offsets: List[int] = None) -> List[Dict]:
+        """Every mention of an Annex I organisation by name or acronym, with offset and page"""
+        return load_institution_index().scan(text, page_offsets)
+
+    def _check_anonymity(self, text: str) -> List[str]:
+        """Check for potential anonymity violations"""
+        return violation_messages(scan_text(text))
+
+    def classify_country(self, name: str) -> Dict:
+        """COST status, ITC flag and ISO code of a country name, alias or ISO code"""
+        return self.countries.classify(name)
+
+    def analyze_participant_roster(self, source, kind: str) -> Dict:
+        """ITC, gender, young researcher and leadership metrics of a CSV/XLSX roster against the policy thresholds"""
+        return analyze_roster(
+            source, kind, self.countries, self.requirements, self.policy_requirements
+        )
+
+    def plan_content_quality_requests(self, text: str) -> PackingPlan:
+        """Plan the section-packed LLM requests needed to cover the whole document"""
+        from .llm_analysis import plan_quality_requests
+        return plan_quality_requests(text, MANDATORY_SECTIONS)
+
+    def analyze_content_quality(self, text: str, mode: str = "map_reduce", plan: PackingPlan = None) -> Dict:
+        """Analyze content quality using AI, over the whole document or only its opening excerpt"""
+        if self.openai_client is None:
+            return error_result("llm_not_configured", "OpenAI API key not configured")
+        
+        if mode == "map_reduce":
+            return self._analyze_content_quality_chunked(plan or self.plan_content_quality_requests(text))
+        
+        from .llm_analysis import build_quality_prompt, parse_json_response, complete_cached
+        try:
+            prompt = build_quality_prompt(text[:2000])
+            
+            with stage_span("llm_request"):
+                content = complete_cached(
+                    self.openai_client, [{"role": "user", "content": prompt}], validate=parse_json_response
+                )
+            
+            result = parse_json_response(content)
+            return result
+            
+        except Exception as e:
+            return error_result("llm_failed", f"AI analysis failed: {str(e)}")
+
+    def _analyze_content_quality_chunked(self, plan: PackingPlan) -> Dict:
+        """Score packed section requests concurrently and merge them into the five dimensions"""
+        from .llm_analysis import analyze_chunks, merge_quality_results
+        from .llm_client import llm_event_loop
+        
+        chunks = plan.requests
+        if not chunks:
+            return error_result("no_text", "No text to analyze")
+        
+        try:
+            with stage_span("llm_requests"):
+                results = llm_event_loop.run(analyze_chunks(self.async_openai_client, chunks))
+        except Exception as e:
+            return error_result("llm_failed", f"AI analysis failed: {str(e)}")
+        
+        merged = merge_quality_results(chunks, results)
+        if "coverage" in merged:
+            merged["coverage"]["estimated_tokens"] = plan.estimated_tokens
+        return merged
+
+    def analyze_section_coverage(self, text: str) -> Dict:
+        """Analyze coverage of required sections"""
+        sections_found = {}
+        
+        # Resolve every keyword hit to the section heading it falls under in one pass. All template headings
+        # are indexed so that text under the unscored ones ("Gantt chart", "Communication, ...") ends the
+        # section above it; those headings map to no section
+        content_structure = self.requirements["content_structure"]
+        heading_to_section = {data["heading"]: section for section, data in content_structure.items()}
+        section_index = SectionIndex(text, list(dict.fromkeys(MANDATORY_SECTIONS + list(heading_to_section))))
+        section_lengths = section_index.section_lengths()
+        
+        keyword_counts = {section: dict.fromkeys(keywords, 0) for section, keywords in SECTION_KEYWORDS.items()}
+        in_section_matches = dict.fromkeys(SECTION_KEYWORDS, 0)
+        for match in SECTION_KEYWORD_PATTERN.finditer(text):
+            keyword = match.group(1).lower()
+            located_section = heading_to_section.get(section_index.section_at(match.start()))
+            for section in KEYWORD_SECTIONS[keyword]:
+                keyword_counts[section][keyword] += 1
+                if located_section == section:
+                    in_section_matches[section] += 1
+        
+        for section, counts in keyword_counts.items():
+            coverage_score = 0
+            for matches in counts.values():
+                coverage_score += min(matches * 10, 50)  # Cap at 50 per keyword
+            
+            heading = content_structure[section]["heading"]
+            sections_found[section] = {
+                "coverage_score": min(coverage_score, 100),
+                "weight": content_structure[section]["weight"],
+                "heading_found": heading in section_index,
+                "section_characters": section_lengths.get(heading, 0),
+                "in_section_matches": in_section_matches[section]
+            }
+        
+        return sections_found
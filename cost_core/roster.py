@@ -0,0 +1,246 @@
+import io
+import re
+from typing import Dict, Iterable, Iterator, List
+from .analysis_cache import read_file_bytes
+from .countries import CountryIndex
+from .errors import AnalysisError, error_result
+from .import_timing import timed_import
+
+# Rows read per chunk, so large consortia never hold more than one chunk of raw cells in memory
+ROSTER_CHUNK_ROWS = 20000
+
+# Canonical roster column -> accepted header spellings, compared after normalising the header
+ROSTER_COLUMNS = {
+    "country": ["country", "participating_country", "country_of_affiliation", "affiliation_country"],
+    "gender": ["gender", "sex"],
+    "yri": ["yri", "young_researcher", "young_researchers_and_innovators", "young_researcher_and_innovator"],
+    "age": ["age"],
+    "role": ["role", "position", "leadership_role", "action_role"]
+}
+FEMALE_VALUES = ["f", "female", "woman", "w"]
+TRUE_VALUES = ["yes", "y", "true", "1", "x"]
+# Young Researchers and Innovators are under 40 when the roster gives ages instead of a YRI flag
+YRI_MAX_AGE = 40
+# Chair, Vice Chair, Working Group leaders, Grant Holder Scientific Representative and the coordinators
+LEADERSHIP_ROLE_PATTERN = r"chair|leader|coordinator|grant holder|representative"
+
+COUNT_COLUMNS = [
+    "participants", "female", "yri", "leaders", "female_leaders", "yri_leaders",
+    "gender_known", "yri_known"
+]
+
+
+def _header_key(header) -> str:
+    return re.sub(r"[\s\-]+", "_", str(header).strip().lower())
+
+
+def _resolve_columns(headers: Iterable) -> Dict[str, str]:
+    """Canonical column -> header as written in the roster"""
+    by_key = {_header_key(header): header for header in headers}
+    resolved = {}
+    for column, spellings in ROSTER_COLUMNS.items():
+        for spelling in spellings:
+            if spelling in by_key:
+                resolved[column] = by_key[spelling]
+                break
+    return resolved
+
+
+def _read_csv_chunks(data: bytes, chunk_rows: int):
+    with timed_import("pandas"):
+        import pandas as pd
+    # Spreadsheets saved with a European locale separate fields with semicolons
+    header = data.split(b"\n", 1)[0]
+    separator = ";" if header.count(b";") > header.count(b",") else ","
+    # Only the columns the metrics need are parsed, all as text
+    wanted = {spelling for spellings in ROSTER_COLUMNS.values() for spelling in spellings}
+    return pd.read_csv(
+        io.BytesIO(data), sep=separator, chunksize=chunk_rows, dtype=str, keep_default_na=False,
+        usecols=lambda header: _header_key(header) in wanted, encoding="utf-8-sig"
+    )
+
+
+def _read_xlsx_chunks(data: bytes, chunk_rows: int) -> Iterator:
+    with timed_import("pandas"):
+        import pandas as pd
+    try:
+        with timed_import("openpyxl"):
+            import openpyxl
+    except ImportError:
+        raise AnalysisError("missing_dependency", "Reading XLSX rosters requires openpyxl (pip install openpyxl)")
+    # Read-only mode streams rows from the sheet XML instead of loading the whole workbook
+    workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        headers = ["" if header is None else str(header) for header in headers]
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_rows:
+                yield pd.DataFrame(chunk, columns=headers)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=headers)
+    finally:
+        workbook.close()
+
+
+def read_roster_chunks(data: bytes, kind: str, chunk_rows: int = ROSTER_CHUNK_ROWS) -> Iterator:
+    """DataFrames of at most chunk_rows participants from a CSV or XLSX roster"""
+    if kind == "csv":
+        return iter(_read_csv_chunks(data, chunk_rows))
+    if kind == "xlsx":
+        return _read_xlsx_chunks(data, chunk_rows)
+    raise AnalysisError("unsupported_format", f"Unsupported roster format: {kind}")
+
+
+def summarise_chunk(chunk, columns: Dict[str, str]):
+    """Participant, female, YRI and leadership counts per country for one chunk"""
+    import pandas as pd
+
+    country = chunk[columns["country"]].fillna("").astype(str).str.strip()
+    index = chunk.index
+    if "gender" in columns:
+        gender = chunk[columns["gender"]].fillna("").astype(str).str.strip().str.lower()
+        female = gender.isin(FEMALE_VALUES)
+        gender_known = gender != ""
+    else:
+        female = gender_known = pd.Series(False, index=index)
+    if "yri" in columns:
+        flag = chunk[columns["yri"]].fillna("").astype(str).str.strip().str.lower()
+        yri = flag.isin(TRUE_VALUES)
+        yri_known = flag != ""
+    elif "age" in columns:
+        age = pd.to_numeric(chunk[columns["age"]], errors="coerce")
+        yri = age < YRI_MAX_AGE
+        yri_known = age.notna()
+    else:
+        yri = yri_known = pd.Series(False, index=index)
+    if "role" in columns:
+        role = chunk[columns["role"]].fillna("").astype(str)
+        leader = role.str.contains(LEADERSHIP_ROLE_PATTERN, case=False, regex=True)
+    else:
+        leader = pd.Series(False, index=index)
+
+    counts = pd.DataFrame({
+        "country": country,
+        "participants": 1,
+        "female": female,
+        "yri": yri,
+        "leaders": leader,
+        "female_leaders": female & leader,
+        "yri_leaders": yri & leader,
+        "gender_known": gender_known,
+        "yri_known": yri_known
+    })
+    return counts[counts["country"] != ""].groupby("country", sort=False)[COUNT_COLUMNS].sum()
+
+
+def _percentage(part: float, whole: float):
+    return round(100.0 * float(part) / float(whole), 1) if whole else None
+
+
+def roster_metrics(per_country, country_index: CountryIndex, columns: Dict[str, str]) -> Dict:
+    """Network-wide policy metrics from the per-country counts"""
+    is_itc = per_country.index.map(country_index.is_itc).to_numpy(dtype=bool)
+    totals = per_country.sum()
+    itc_totals = per_country[is_itc].sum()
+    # Only COST Full and Cooperating Members count toward the country minimum and the ITC share of countries;
+    # an Outermost Region counts as its member state, and partner countries are reported on their own
+    members = per_country.index.map(country_index.member_country)
+    member_countries = set(members.dropna())
+    itc_members = sum(1 for member in member_countries if country_index.is_itc(member))
+    has_gender = "gender" in columns
+    has_yri = "yri" in columns or "age" in columns
+    has_roles = "role" in columns
+    return {
+        "participants": int(totals["participants"]),
+        "country_count": int(len(per_country)),
+        "member_country_count": len(member_countries),
+        "partner_country_count": int(members.isna().sum()),
+        "itc_country_count": itc_members,
+        "itc_country_share": _percentage(itc_members, len(member_countries)),
+        "itc_participant_share": _percentage(itc_totals["participants"], totals["participants"]),
+        "female_participation": _percentage(totals["female"], totals["gender_known"]) if has_gender else None,
+        "yri_participation": _percentage(totals["yri"], totals["yri_known"]) if has_yri else None,
+        "leaders": int(totals["leaders"]) if has_roles else None,
+        "itc_leadership": _percentage(itc_totals["leaders"], totals["leaders"]) if has_roles else None,
+        "female_leadership": _percentage(totals["female_leaders"], totals["leaders"])
+        if has_roles and has_gender else None,
+        "yri_leadership": _percentage(totals["yri_leaders"], totals["leaders"]) if has_roles and has_yri else None
+    }
+
+
+def policy_checks(metrics: Dict, requirements: Dict, policy_requirements: Dict) -> List[Dict]:
+    """Each metric against its threshold; met is None when the roster lacks the columns to measure it"""
+    network = requirements["network_requirements"]
+    thresholds = [
+        ("Participating COST Members", "member_country_count", network["min_countries"]),
+        ("ITC share of COST Members (%)", "itc_country_share", network["min_itc_percentage"]),
+        ("ITC participation (%)", "itc_participant_share", policy_requirements["inclusiveness"]["itc_participation_min"]),
+        ("ITC leadership (%)", "itc_leadership", policy_requirements["inclusiveness"]["itc_leadership_min"]),
+        ("Female participation (%)", "female_participation",
+         policy_requirements["gender_equality"]["female_participation_target"]),
+        ("YRI participation (%)", "yri_participation", policy_requirements["young_researchers"]["yri_participation_min"]),
+        ("YRI leadership (%)", "yri_leadership", policy_requirements["young_researchers"]["yri_leadership_allocation"])
+    ]
+    checks = []
+    for label, metric, threshold in thresholds:
+        value = metrics[metric]
+        checks.append({
+            "requirement": label,
+            "metric": metric,
+            "value": value,
+            "threshold": threshold,
+            "met": None if value is None else bool(value >= threshold)
+        })
+    return checks
+
+
+def analyze_roster(source, kind: str, country_index: CountryIndex, requirements: Dict, policy_requirements: Dict,
+                   chunk_rows: int = ROSTER_CHUNK_ROWS) -> Dict:
+    """Policy metrics and threshold checks for a participant roster, or a structured error result"""
+    try:
+        import pandas as pd
+
+        per_country = []
+        columns = None
+        for chunk in read_roster_chunks(read_file_bytes(source), kind, chunk_rows):
+            if columns is None:
+                columns = _resolve_columns(chunk.columns)
+                if "country" not in columns:
+                    return error_result("missing_columns", "The roster needs a country column")
+            per_country.append(summarise_chunk(chunk, columns))
+        # Chunk summaries are combined per country, so the chunk size never changes the result
+        combined = pd.concat(per_country).groupby(level=0, sort=False).sum() if per_country else None
+        if combined is None or combined.empty:
+            return error_result("empty_roster", "The roster has no participants with a country")
+        # Spellings, aliases and ISO codes of the same country ("Czechia", "CZ") are merged under the
+        # Annex I name; only the distinct values are looked up
+        combined.index = combined.index.map(country_index.canonical_name)
+        combined = combined.groupby(level=0, sort=False).sum()
+        combined = combined.sort_values("participants", ascending=False, kind="stable")
+        metrics = roster_metrics(combined, country_index, columns)
+        countries = []
+        for country, row in combined.to_dict("index").items():
+            classification = country_index.classify(country)
+            countries.append({
+                "country": country,
+                "iso_code": classification["iso_code"],
+                "status": classification["status"],
+                "itc": classification["itc"],
+                **{key: int(value) for key, value in row.items()}
+            })
+        return {
+            "metrics": metrics,
+            "checks": policy_checks(metrics, requirements, policy_requirements),
+            "countries": countries,
+            "columns": columns
+        }
+    except AnalysisError as e:
+        return e.to_dict()
+    except Exception as e:
+        return error_result("roster_failed", f"Error reading roster: {str(e)}")
@@ -0,0 +1,151 @@
+import re
+from typing import Dict, List
+
+# Groups whose text is formatting metadata rather than document content
+SKIPPED_DESTINATIONS = {
+    "fonttbl", "colortbl", "stylesheet", "listtable", "listoverridetable", "info", "pict",
+    "header", "footer", "headerl", "headerr", "footerl", "footerr", "xmlnstbl", "themedata",
+    "colorschememapping", "latentstyles", "datastore", "rsidtbl", "generator", "object", "listtext"
+}
+TOKEN_PATTERN = re.compile(
+    r"\\([a-z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-f]{2})|\\([^a-z])|([{}])|[\r\n]+|([^\\{}\r\n]+)",
+    re.IGNORECASE
+)
+# Points; RTF text without an \fs control word is 24 half-points
+DEFAULT_FONT_SIZE = 12
+INLINE_BREAKS = {"line": "\n", "tab": "\t"}
+PARAGRAPH_BREAKS = {"par", "sect", "page"}
+
+
+def _clean(text: str) -> str:
+    """Collapse the runs of spaces left behind by character-spacing control words"""
+    return " ".join(text.split())
+
+
+def parse_rtf(rtf: str) -> List[Dict]:
+    """Paragraphs and table rows of an RTF document in reading order
+
+    Paragraphs are {"kind": "paragraph", "text", "bold", "size"} and table rows are
+    {"kind": "row", "cells", "bold", "size"}, where bold and size (in points) describe the block's
+    first text run. Superscript runs, such as footnote reference marks, are left out.
+    """
+    blocks = []
+    text = []
+    cells = []
+    block_bold = None
+    block_size = None
+    in_table = False
+    bold = False
+    font_size = DEFAULT_FONT_SIZE
+    superscript = False
+    skipping = False
+    unicode_skip = 1
+    pending_skip = 0
+    stack = []
+
+    def emit(chars: str):
+        nonlocal block_bold, block_size
+        if superscript:
+            return
+        if block_bold is None and chars.strip():
+            block_bold = bold
+            block_size = font_size
+        text.append(chars)
+
+    for match in TOKEN_PATTERN.finditer(rtf):
+        word, argument, hex_code, symbol, brace, literal = match.groups()
+        if brace == "{":
+            stack.append((skipping, unicode_skip, bold, font_size, superscript))
+            continue
+        if brace == "}":
+            if stack:
+                skipping, unicode_skip, bold, font_size, superscript = stack.pop()
+            continue
+        if pending_skip and (hex_code or literal):
+            # Characters after \uN are the ANSI fallback for readers without Unicode support
+            if literal:
+                consumed = min(pending_skip, len(literal))
+                literal = literal[consumed:]
+                pending_skip -= consumed
+            else:
+                pending_skip -= 1
+                continue
+        if symbol is not None:
+            if symbol == "*":
+                skipping = True
+            elif not skipping and symbol in "\\{}":
+                emit(symbol)
+            elif not skipping and symbol == "~":
+                emit(" ")
+            continue
+        if word is not None:
+            word = word.lower()
+            if word in SKIPPED_DESTINATIONS:
+                skipping = True
+            elif word == "uc":
+                unicode_skip = int(argument or 1)
+            elif word == "u" and argument is not None:
+                if not skipping:
+                    emit(chr(int(argument) % 65536))
+                pending_skip = unicode_skip
+            elif word == "b":
+                bold = argument != "0"
+            elif word == "fs":
+                font_size = int(argument or DEFAULT_FONT_SIZE * 2) / 2
+            elif word == "super":
+                superscript = argument != "0"
+            elif word in ("nosupersub", "sub"):
+                superscript = False
+            elif word == "plain":
+                bold = False
+                font_size = DEFAULT_FONT_SIZE
+                superscript = False
+            elif word == "intbl":
+                in_table = True
+            elif skipping:
+                continue
+            elif word in INLINE_BREAKS:
+                emit(INLINE_BREAKS[word])
+            elif word == "cell":
+                cells.append(_clean("".join(text)))
+                text.clear()
+            elif word == "row":
+                if any(cells):
+                    blocks.append({"kind": "row", "cells": cells, "bold": bool(block_bold), "size": block_size})
+                cells = []
+                block_bold = None
+                block_size = None
+                in_table = False
+            elif word in PARAGRAPH_BREAKS:
+                if in_table:
+                    # Paragraph breaks inside a cell only separate lines of that cell
+                    emit(" ")
+                else:
+                    paragraph = _clean("".join(text))
+                    if paragraph:
+                        blocks.append(
+                            {"kind": "paragraph", "text": paragraph, "bold": bool(block_bold), "size": block_size}
+                        )
+                    text.clear()
+                    block_bold = None
+                    block_size = None
+            continue
+        if skipping:
+            continue
+        if hex_code is not None:
+            emit(bytes([int(hex_code, 16)]).decode("cp1252", errors="replace"))
+        elif literal:
+            emit(literal)
+
+    paragraph = _clean("".join(text))
+    if paragraph:
+        blocks.append({"kind": "paragraph", "text": paragraph, "bold": bool(block_bold), "size": block_size})
+    return blocks
+
+
+def rtf_to_text(rtf: str) -> str:
+    """Plain text of an RTF document: one line per paragraph and per table row, cells separated by tabs"""
+    lines = []
+    for block in parse_rtf(rtf):
+        lines.append(block["text"] if block["kind"] == "paragraph" else "\t".join(block["cells"]))
+    return "".join(f"{line}\n" for line in lines)
@@ -0,0 +1,82 @@
+import re
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+# Optional "1.", "A." or "2.1" style enumerator in front of a section heading
+HEADER_PATTERN = re.compile(
+    r"^[ \t]*(?P<number>(?:[0-9]{1,2}(?:\.[0-9]{1,2})+[.)]?|[A-Z0-9]{1,3}[.)])[ \t]*)?"
+    r"(?P<title>[^\n]{3,120})$",
+    re.MULTILINE
+)
+# Characters a numbered heading may carry after its title, e.g. "C. Deliverables (see Table 3)"
+MAX_HEADING_SUFFIX = 10
+
+UNASSIGNED_SECTION = "Unassigned"
+
+# Main headings of the mandatory Technical Annex template, in template order
+MANDATORY_SECTIONS = [
+    "State-of-the-art",
+    "Rationale for choosing networking to address the main challenge",
+    "Critical mass of the network",
+    "Impact related to objectives",
+    "Involvement of stakeholders",
+    "Communication, dissemination and valorisation",
+    "Action Structure",
+    "Work plan (tasks, activities and timeframe)",
+    "Deliverables",
+    "Gantt chart"
+]
+
+
+def _squash(text: str) -> str:
+    """Lowercase alphanumerics only, tolerant of the stray spaces PDF extraction inserts"""
+    return "".join(char for char in text.lower() if char.isalnum())
+
+
+def detect_section_headers(text: str, section_titles: List[str]) -> List[Tuple[int, str]]:
+    """Find (character_offset, section_title) for each heading line matching a section title"""
+    squashed_titles = [(_squash(title), title) for title in section_titles]
+    headers = []
+    for match in HEADER_PATTERN.finditer(text):
+        line = _squash(match.group("title"))
+        # An unnumbered heading is the whole line; only numbered ones may carry a little trailing text,
+        # so body lines such as "Deliverables are due ..." do not match
+        slack = MAX_HEADING_SUFFIX if match.group("number") else 0
+        for squashed, title in squashed_titles:
+            if line.startswith(squashed) and len(line) <= len(squashed) + slack:
+                headers.append((match.start(), title))
+                break
+    return headers
+
+
+class SectionIndex:
+    """Section heading offsets detected once and resolved for any text position by binary search"""
+
+    def __init__(self, text: str, section_titles: List[str]):
+        headers = detect_section_headers(text, section_titles)
+        self.offsets = [offset for offset, _ in headers]
+        self.titles = [title for _, title in headers]
+        self.text_length = len(text)
+
+    def section_at(self, position: int) -> str:
+        """Section containing a character position, or UNASSIGNED_SECTION before the first heading"""
+        index = bisect_right(self.offsets, position) - 1
+        return self.titles[index] if index >= 0 else UNASSIGNED_SECTION
+
+    def sections_for(self, positions: List[int]) -> List[str]:
+        return [self.section_at(position) for position in positions]
+
+    def spans(self) -> List[Tuple[str, int, int]]:
+        """(section_title, start, end) for every detected heading, in document order"""
+        ends = self.offsets[1:] + [self.text_length]
+        return list(zip(self.titles, self.offsets, ends))
+
+    def section_lengths(self) -> Dict[str, int]:
+        """Characters of text under each detected section, summed over repeated headings"""
+        lengths = {}
+        for title, start, end in self.spans():
+            lengths[title] = lengths.get(title, 0) + end - start
+        return lengths
+
+    def __contains__(self, title: str) -> bool:
+        return title in self.titles
@@ -0,0 +1,83 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List
+
+# Timer of the request being processed in this context; None when no request is being timed
+_active_timer: ContextVar = ContextVar("active_stage_timer", default=None)
+
+
+class StageTimer:
+    """Wall-clock spans for the pipeline stages of one analysis request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: List[Dict] = []
+        self._open: List[str] = []
+
+    @contextmanager
+    def span(self, stage: str):
+        """Time the block as a stage, nested under any span still open on this timer"""
+        path = "/".join(self._open + [stage])
+        self._open.append(stage)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._open.pop()
+            self.spans.append({
+                "stage": stage,
+                "path": path,
+                "depth": path.count("/"),
+                "offset_seconds": started - self.started,
+                "seconds": time.perf_counter() - started
+            })
+
+    @contextmanager
+    def activate(self):
+        """Make this timer collect the stage_span() calls made inside the analysis code"""
+        token = _active_timer.set(self)
+        try:
+            yield self
+        finally:
+            _active_timer.reset(token)
+
+    def totals(self) -> Dict[str, float]:
+        """Seconds per stage path, summed over repeated spans, in the order stages first started"""
+        totals = {}
+        for span in sorted(self.spans, key=lambda span: span["offset_seconds"]):
+            totals[span["path"]] = totals.get(span["path"], 0.0) + span["seconds"]
+        return totals
+
+    def total_seconds(self) -> float:
+        """Time covered by top-level spans; nested spans are already included in their parents"""
+        return sum(span["seconds"] for span in self.spans if span["depth"] == 0)
+
+    def report(self) -> List[Dict]:
+        """Spans in start order with rounded times and each one's share of the top-level total"""
+        total = self.total_seconds()
+        return [
+            {
+                "stage": span["stage"],
+                "path": span["path"],
+                "depth": span["depth"],
+                "offset_seconds": round(span["offset_seconds"], 4),
+                "seconds": round(span["seconds"], 4),
+                "share": round(span["seconds"] / total, 4) if total > 0 else 0.0
+            }
+            for span in sorted(self.spans, key=lambda span: span["offset_seconds"])
+        ]
+
+    def to_dict(self) -> Dict:
+        return {"total_seconds": round(self.total_seconds(), 4), "spans": self.report()}
+
+
+@contextmanager
+def stage_span(stage: str):
+    """Span on the active timer, or a no-op when no request is being timed"""
+    timer = _active_timer.get()
+    if timer is None:
+        yield
+    else:
+        with timer.span(stage):
+            yield
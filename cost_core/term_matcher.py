@@ -0,0 +1,146 @@
+import re
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Tuple
+import numpy as np
+
+# family -> criterion -> (terms, points awarded per distinct term present)
+Lexicons = Dict[str, Dict[str, Tuple[List[str], int]]]
+
+
+def _term_variants(term: str) -> List[str]:
+    """Surface forms matched for a lexicon term: the term itself plus inflections of its last word
+
+    Plurals and third person (-s/-es/-ies), past forms (-ed/-d/-ied, -n/-en as in "shown", "proven"),
+    -ing forms and -ity nouns ("originality", "responsibility") keep the hits that substring matching
+    used to score; forms that are not English words simply never occur.
+    """
+    variants = [term, term + "s", term + "es"]
+    consonant_y = term.endswith("y") and len(term) > 1 and term[-2] not in "aeiou"
+    if consonant_y:
+        variants += [term[:-1] + "ies", term[:-1] + "ied"]
+    if term.endswith("e"):
+        variants += [term + "d", term + "n", term[:-1] + "ing", term[:-1] + "ity"]
+    else:
+        variants += [term + "ed", term + "en", term + "n", term + "ing"]
+    if term.endswith("ble"):
+        variants.append(term[:-3] + "bility")
+    elif not term.endswith("e") and not consonant_y:
+        variants.append(term + "ity")
+    return variants
+
+
+def _trie_pattern(words: Iterable[str], escape: Callable[[str], str] = re.escape) -> str:
+    """Build a prefix-factored alternation so the regex engine walks a trie, longest match first"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        is_end = "" in node
+        branches = [escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1:
+            body = branches[0]
+            group = f"(?:{body})" if is_end and len(body) > 1 else body
+        else:
+            group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if is_end else group
+
+    return build(trie)
+
+
+def _starts_with_word(haystack: str, needle: str) -> bool:
+    """True if haystack starts with needle followed by a word boundary"""
+    return haystack.startswith(needle) and (len(haystack) == len(needle) or not haystack[len(needle)].isalnum())
+
+
+class TermMatcher:
+    """Compiles term lexicons into a single word-boundary-aware pattern scanned in one pass"""
+
+    def __init__(self, lexicons: Lexicons):
+        self.lexicons = {
+            family: {
+                criterion: (tuple(term.lower() for term in term_list), points)
+                for criterion, (term_list, points) in criteria.items()
+            }
+            for family, criteria in lexicons.items()
+        }
+        terms = sorted({term for criteria in self.lexicons.values()
+                        for term_list, _ in criteria.values() for term in term_list})
+
+        # Exact terms take precedence over another term's plural form
+        self._variant_to_term = {term: term for term in terms}
+        for term in terms:
+            for variant in _term_variants(term):
+                self._variant_to_term.setdefault(variant, term)
+
+        # The lookahead reports the longest term starting at every word, so overlapping terms such as
+        # "public policy" and "policy maker" in "public policy maker" are both found
+        self.pattern = re.compile(r"\b(?=(" + _trie_pattern(self._variant_to_term) + r")\b)")
+
+        # Only the longest term at each word is reported, so a hit on "economic value" also has to
+        # credit the shorter term "economic" that starts at the same word
+        self._nested_terms = {
+            term: [other for other in terms if other != term and
+                   any(_starts_with_word(term, variant) for variant in _term_variants(other))]
+            for term in terms
+        }
+        self.terms = terms
+        self.term_index = {term: index for index, term in enumerate(terms)}
+        # Column order of score matrices: one column per (family, criterion)
+        self.columns = [(family, criterion) for family, criteria in self.lexicons.items() for criterion in criteria]
+
+        self.points = np.zeros((len(terms), len(self.columns)), dtype=np.int32)
+        for column, (family, criterion) in enumerate(self.columns):
+            term_list, points = self.lexicons[family][criterion]
+            for term in term_list:
+                self.points[self.term_index[term], column] = points
+
+    def scan(self, text: str) -> Counter:
+        """Count occurrences of every lexicon term in one pass over the text"""
+        counts = Counter()
+        for match in self.pattern.finditer(text.lower()):
+            term = self._variant_to_term[match.group(1)]
+            counts[term] += 1
+            for nested in self._nested_terms[term]:
+                counts[nested] += 1
+        return counts
+
+    def hit_counts(self, counts: Counter) -> Dict[str, Dict[str, int]]:
+        """Per-criterion number of term occurrences"""
+        return {
+            family: {
+                criterion: sum(counts.get(term, 0) for term in term_list)
+                for criterion, (term_list, _) in criteria.items()
+            }
+            for family, criteria in self.lexicons.items()
+        }
+
+    def score(self, counts: Counter, cap: int = 5) -> Dict[str, Dict[str, int]]:
+        """Per-criterion score: points for each distinct term present, capped"""
+        return {
+            family: {
+                criterion: min(cap, sum(points for term in term_list if counts.get(term)))
+                for criterion, (term_list, points) in criteria.items()
+            }
+            for family, criteria in self.lexicons.items()
+        }
+
+    def presence_matrix(self, texts: List[str]) -> np.ndarray:
+        """Boolean (texts x terms) matrix of which terms occur in each text"""
+        rows, cols = [], []
+        for row, text in enumerate(texts):
+            for term in self.scan(text):
+                rows.append(row)
+                cols.append(self.term_index[term])
+        presence = np.zeros((len(texts), len(self.terms)), dtype=np.int32)
+        presence[rows, cols] = 1
+        return presence
+
+    def score_matrix(self, texts: List[str], cap: int = 5) -> np.ndarray:
+        """(texts x columns) matrix of capped criterion scores, equivalent to score() per text"""
+        return np.minimum(self.presence_matrix(texts) @ self.points, cap)
@@ -0,0 +1,184 @@
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Tuple
+from .analysis_cache import content_hash, extraction_cache, read_file_bytes
+from .anonymity import AnonymityScanner
+from .errors import error_result
+from .import_timing import timed_import
+from .stage_timing import stage_span
+
+# Documents with at least this many pages are extracted across a process pool
+PARALLEL_PAGE_THRESHOLD = int(os.environ.get("COST_PARALLEL_PAGE_THRESHOLD", "40"))
+
+
+def _open_pdf(source):
+    """Open a PdfReader from raw bytes, a path or a file-like object"""
+    # PDF and DOCX libraries are loaded on first extraction rather than at import time
+    with timed_import("PyPDF2"):
+        import PyPDF2
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    return PyPDF2.PdfReader(source)
+
+
+def count_pdf_pages(source) -> int:
+    """Read the page count from the PDF page tree without extracting any text"""
+    return len(_open_pdf(source).pages)
+
+
+def iter_pdf_pages(source) -> Iterator[Tuple[int, str]]:
+    """Yield (page_number, text) records one page at a time, page numbers starting at 1"""
+    pdf_reader = _open_pdf(source)
+    for index, page in enumerate(pdf_reader.pages):
+        yield index + 1, page.extract_text() or ""
+
+
+def join_pages(records: Iterable[Tuple[int, str]]) -> str:
+    """Join streamed page records into one document, one trailing newline per page"""
+    return "".join(f"{text}\n" for _, text in records)
+
+
+# Worker process state: the PdfReader of the document its last task belonged to, keyed by content hash,
+# so a worker that picks up several ranges of one document parses it once
+_worker_document = (None, None)
+
+
+def _extract_page_range(key: str, data: bytes, start: int, stop: int) -> List[Tuple[int, str]]:
+    """Worker task: extract pages [start, stop) from raw PDF bytes"""
+    global _worker_document
+    if _worker_document[0] != key:
+        _worker_document = (key, _open_pdf(data))
+    pdf_reader = _worker_document[1]
+    return [(index + 1, pdf_reader.pages[index].extract_text() or "") for index in range(start, stop)]
+
+
+def _shard_ranges(page_count: int, shard_count: int) -> List[Tuple[int, int]]:
+    """Split page indices into contiguous, roughly equal ranges"""
+    shard_size = -(-page_count // shard_count)
+    return [(start, min(start + shard_size, page_count)) for start in range(0, page_count, shard_size)]
+
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _extraction_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by every parallel extraction, recreated only when the worker count changes"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=max_workers)
+            _pool_workers = max_workers
+        return _pool
+
+
+def _discard_pool(executor: ProcessPoolExecutor):
+    global _pool
+    with _pool_lock:
+        if _pool is executor:
+            _pool = None
+    executor.shutdown(wait=False)
+
+
+def iter_pdf_pages_parallel(data: bytes, page_count: int, max_workers: int = None) -> Iterator[Tuple[int, str]]:
+    """Extract page ranges across a process pool and yield (page_number, text) records in page order"""
+    max_workers = max_workers or os.cpu_count() or 1
+    # One contiguous range per worker: each worker receives the bytes and parses the PDF once
+    ranges = _shard_ranges(page_count, max_workers)
+    key = content_hash(data)
+    executor = _extraction_pool(max_workers)
+    try:
+        futures = [executor.submit(_extract_page_range, key, data, start, stop) for start, stop in ranges]
+        for future in futures:
+            yield from future.result()
+    except BrokenProcessPool:
+        # A crashed worker breaks the whole pool; the next extraction starts a fresh one
+        _discard_pool(executor)
+        raise
+
+
+def collect_pages(records: Iterable[Tuple[int, str]]) -> Tuple[List[Tuple[int, str]], List[Dict]]:
+    """Materialise page records, scanning each page for anonymity violations as soon as it is extracted"""
+    scanner = AnonymityScanner()
+    collected = []
+    for page, text in records:
+        scanner.feed(page, text)
+        collected.append((page, text))
+    return collected, scanner.violations
+
+
+def page_offsets(records: List[Tuple[int, str]]) -> List[int]:
+    """Character offset of each page within the text produced by join_pages"""
+    offsets = []
+    position = 0
+    for _, text in records:
+        offsets.append(position)
+        position += len(text) + 1
+    return offsets
+
+
+def extract_pdf_document(data: bytes, parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+                         max_workers: int = None) -> Dict:
+    """Extract a PDF into joined text, per-page offsets and anonymity violations, in parallel for large documents"""
+    page_count = count_pdf_pages(data)
+    records = None
+    # The anonymity scan runs on each page (or shard of pages) while later ones are still being extracted
+    if page_count >= parallel_threshold and (max_workers or os.cpu_count() or 1) > 1:
+        try:
+            records, violations = collect_pages(iter_pdf_pages_parallel(data, page_count, max_workers))
+        except (OSError, RuntimeError):
+            # Process pools can be unavailable in restricted hosts; fall back to serial extraction
+            records = None
+    if records is None:
+        records, violations = collect_pages(iter_pdf_pages(data))
+
+    return {
+        "text": join_pages(records),
+        "page_offsets": page_offsets(records),
+        "page_count": page_count,
+        "anonymity_violations": violations
+    }
+
+
+def extract_docx_document(data: bytes) -> Dict:
+    """Extract a DOCX into joined paragraph text; DOCX files carry no page offsets"""
+    with timed_import("docx"):
+        from docx import Document
+    doc = Document(io.BytesIO(data))
+    # Paragraphs are joined like pages, one newline each, so the scanner's offsets line up with the text
+    records, violations = collect_pages((None, paragraph.text) for paragraph in doc.paragraphs)
+    return {
+        "text": join_pages(records),
+        "page_offsets": [],
+        "page_count": None,
+        "anonymity_violations": violations
+    }
+
+
+def extract_document(data: bytes, kind: str, parallel_threshold: int = PARALLEL_PAGE_THRESHOLD) -> Dict:
+    """Extract a PDF or DOCX document, served from the extraction cache when the bytes are unchanged"""
+    cache_key = extraction_cache.make_key(data, kind)
+    document = extraction_cache.get(cache_key)
+    if document is None:
+        # Only a cache miss parses the file, so the span shows whether extraction was served from cache
+        with stage_span(f"parse_{kind}"):
+            if kind == "pdf":
+                document = extract_pdf_document(data, parallel_threshold=parallel_threshold)
+            else:
+                document = extract_docx_document(data)
+        extraction_cache.put(cache_key, document)
+    return document
+
+
+def load_document(source, kind: str, parallel_threshold: int = PARALLEL_PAGE_THRESHOLD) -> Dict:
+    """Extract raw bytes, an uploaded file or a path, returning a structured error result on failure"""
+    try:
+        return extract_document(read_file_bytes(source), kind, parallel_threshold)
+    except Exception as e:
+        return error_result("extraction_failed", f"Error reading {kind.upper()}: {str(e)}")
@@ -0,0 +1,198 @@
+"""Local OpenAI-compatible chat-completions stub for offline benchmarking
+
+Run:  python openai_stub_server.py --port 8901 --latency lognormal --latency-mean 0.8 --error-rate 0.05
+Then set OPENAI_BASE_URL=http://127.0.0.1:8901/v1 (environment or .streamlit/secrets.toml).
+"""
+import json
+import math
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from cost_core.llm_analysis import QUALITY_DIMENSIONS
+from cost_core.prompt_packer import estimate_tokens
+
+LATENCY_DISTRIBUTIONS = ["fixed", "uniform", "normal", "lognormal"]
+
+
+class StubConfig:
+    """Latency, error injection and canned reply settings shared by all request handlers"""
+
+    def __init__(self, latency: str = "fixed", latency_mean: float = 0.0, latency_spread: float = 0.0,
+                 error_rate: float = 0.0, error_statuses: List[int] = None, retry_after: float = 1.0,
+                 scores: Dict = None, seed: int = 0):
+        self.latency = latency
+        self.latency_mean = latency_mean
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses or [429, 500, 503]
+        self.retry_after = retry_after
+        self.scores = scores
+        self.seed = seed
+        self.requests = 0
+        self.errors = 0
+        self._occurrences = {}
+        self._lock = threading.Lock()
+
+    def rng_for(self, body: bytes) -> random.Random:
+        """Generator seeded by the request body and how often it was seen, independent of arrival order"""
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self.requests += 1
+            occurrence = self._occurrences.get(digest, 0)
+            self._occurrences[digest] = occurrence + 1
+        return random.Random(f"{self.seed}:{digest}:{occurrence}")
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.latency == "uniform":
+            delay = rng.uniform(self.latency_mean - self.latency_spread, self.latency_mean + self.latency_spread)
+        elif self.latency == "normal":
+            delay = rng.gauss(self.latency_mean, self.latency_spread)
+        elif self.latency == "lognormal" and self.latency_mean > 0:
+            # Parameterised by the mean and standard deviation of the delay itself
+            variance_ratio = 1 + (self.latency_spread / self.latency_mean) ** 2
+            mu = math.log(self.latency_mean / math.sqrt(variance_ratio))
+            delay = rng.lognormvariate(mu, math.sqrt(math.log(variance_ratio)))
+        else:
+            delay = self.latency_mean
+        return max(0.0, delay)
+
+    def reply_content(self, prompt: str) -> str:
+        """Canned scores if configured, otherwise stable pseudo-scores derived from the prompt"""
+        if self.scores is not None:
+            return json.dumps(self.scores)
+        prompt_rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+        return json.dumps({
+            dimension: {"score": prompt_rng.randint(2, 5), "justification": f"Stub assessment of {dimension}"}
+            for dimension in QUALITY_DIMENSIONS
+        })
+
+    def stats(self) -> Dict:
+        return {"requests": self.requests, "errors": self.errors}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    config: StubConfig = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict, headers: Dict = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]})
+        elif self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.config.stats())
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            request = json.loads(body)
+            messages = request["messages"]
+        except (ValueError, KeyError, TypeError):
+            self._send_json(400, {"error": {"message": "Malformed chat completion request", "type": "invalid_request_error"}})
+            return
+
+        config = self.config
+        rng = config.rng_for(body)
+        time.sleep(config.sample_latency(rng))
+
+        if rng.random() < config.error_rate:
+            status = rng.choice(config.error_statuses)
+            with config._lock:
+                config.errors += 1
+            headers = {"Retry-After": str(config.retry_after)} if status == 429 else None
+            self._send_json(status, {"error": {"message": f"Injected error {status}", "type": "stub_error"}}, headers)
+            return
+
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        content = config.reply_content(prompt)
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(content)
+        self._send_json(200, {
+            "id": f"chatcmpl-stub-{config.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+
+def create_server(config: StubConfig, host: str = "127.0.0.1", port: int = 8901) -> ThreadingHTTPServer:
+    """Bind a threaded stub server; port 0 picks a free port, see server.server_address"""
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible chat-completions stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-mean", type=float, default=0.0, help="Mean reply delay in seconds")
+    parser.add_argument("--latency-spread", type=float, default=0.0,
+                        help="Half-width (uniform) or standard deviation (normal, lognormal) in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-statuses", default="429,500,503", help="Comma-separated HTTP statuses to inject")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with injected 429s")
+    parser.add_argument("--scores", help="JSON file with a canned reply returned for every request")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    scores = None
+    if args.scores:
+        with open(args.scores, "r", encoding="utf-8") as handle:
+            scores = json.load(handle)
+
+    config = StubConfig(
+        latency=args.latency,
+        latency_mean=args.latency_mean,
+        latency_spread=args.latency_spread,
+        error_rate=args.error_rate,
+        error_statuses=[int(status) for status in args.error_statuses.split(",") if status.strip()],
+        retry_after=args.retry_after,
+        scores=scores,
+        seed=args.seed
+    )
+    server = create_server(config, args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"OpenAI stub listening on http://{host}:{port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()